@@ -4,6 +4,7 @@ from .loader import (
     get_detection_strategy,
     get_entities_to_mask,
     get_entity_categories,
+    get_nlp_model_size,
     get_transformer_config,
     load_config,
 )
@@ -12,6 +13,7 @@ __all__ = [
     "get_detection_strategy",
     "get_entities_to_mask",
     "get_entity_categories",
+    "get_nlp_model_size",
     "get_transformer_config",
     "load_config",
 ]
@@ -3,10 +3,43 @@
 This module handles loading and parsing of config.yaml settings.
 """
 
+import copy
+import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
+
+@lru_cache(maxsize=1)
+def _yaml_loader() -> type:
+    """Pick libyaml's CSafeLoader, warning once if only SafeLoader exists."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        warnings.warn(
+            "libyaml is not available; config.yaml is parsed with the slower "
+            "pure-Python SafeLoader. Reinstall PyYAML with libyaml to speed this up.",
+            stacklevel=2
+        )
+        loader = yaml.SafeLoader
+    return loader
+
+
+@lru_cache(maxsize=16)
+def _load_config_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """
+    Parse a YAML config file once per (path, mtime).
+    
+    The mtime (in integer nanoseconds, so sub-second edits are not missed)
+    is part of the key so an edited config.yaml is re-read.
+    Uses libyaml's CSafeLoader when available (~10x faster than the
+    pure-Python SafeLoader).
+    """
+    import yaml
+
+    with open(path_str, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_yaml_loader()) or {}
 
 
 def load_config(config_path: str | None = None) -> dict[str, Any]:
@@ -17,7 +50,7 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
         config_path: Path to config file. Defaults to config.yaml in project root.
         
     Returns:
-        Configuration dictionary
+        Configuration dictionary (a fresh copy; callers may modify it)
     """
     if config_path is None:
         # Look for config.yaml in project root (parent of config/)
@@ -25,10 +58,11 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
     else:
         config_path = Path(config_path)
 
-    if config_path.exists():
-        with open(config_path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return copy.deepcopy(_load_config_cached(str(config_path.resolve()), mtime_ns))
 
 
 def get_transformer_config(config: dict[str, Any]) -> dict[str, Any]:
@@ -43,22 +77,44 @@ def get_transformer_config(config: dict[str, Any]) -> dict[str, Any]:
         - enabled: bool
         - device: str ("cpu" or "cuda")
         - min_confidence: float
+        - batch_size: int (texts per forward pass in batched inference)
+        - fp16: bool (half-precision weights; defaults to True on CUDA)
+        - int8: bool (dynamic int8 quantization on CPU; defaults to False)
         - models_registry: dict (from models.registry)
         - models_defaults: dict (from models.defaults)
     """
     transformer = config.get("transformer", {})
     models = config.get("models", {})
 
+    device = transformer.get("device", "cpu")
+
     return {
         "enabled": transformer.get("enabled", False),
-        "device": transformer.get("device", "cpu"),
+        "device": device,
         "min_confidence": transformer.get("min_confidence", 0.8),
+        "batch_size": transformer.get("batch_size", 16),
+        "fp16": transformer.get("fp16", str(device).startswith("cuda")),
+        "int8": transformer.get("int8", False),
         # Model Registry info
         "models_registry": models.get("registry", {}),
         "models_defaults": models.get("defaults", {}),
     }
 
 
+def get_nlp_model_size(config: dict[str, Any]) -> str | None:
+    """
+    Get the English spaCy model size used by the analyzers.
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        "sm", "md" or "lg" from nlp.en_model_size, or None for the
+        analyzer factories' own defaults
+    """
+    return config.get("nlp", {}).get("en_model_size")
+
+
 def get_detection_strategy(config: dict[str, Any]) -> dict[str, list]:
     """
     Get detection strategy configuration.
@@ -6,32 +6,44 @@ This package contains the main masking logic:
 - processors: Text preprocessing and result processing
 - protocols: Protocol definitions for dependency abstraction
 - masking_result: Structured result classes
+
+Names are resolved lazily (PEP 562): importing a submodule such as
+core.analyzer or core.allow_list does not pull in core.masker (and with it
+Presidio) until Masker is actually used.
 """
 
-from .analyzer import (
-    create_analyzer,
-    create_japanese_analyzer,
-    create_multilingual_analyzer,
-)
-from .masker import Masker
-from .masking_result import EntityInfo, MaskingResult, MaskingStats
-from .protocols import AnonymizerProtocol, LoggerProtocol, NullLogger, TextExtractorProtocol
+from importlib import import_module
 
-__all__ = [
+# Public name -> submodule that defines it
+_EXPORTS = {
     # Domain
-    "Masker",
-    "MaskingResult",
-    "EntityInfo",
-    "MaskingStats",
+    "Masker": "masker",
+    "MaskingResult": "masking_result",
+    "EntityInfo": "masking_result",
+    "MaskingStats": "masking_result",
     # Analyzer
-    "create_analyzer",
-    "create_japanese_analyzer",
-    "create_multilingual_analyzer",
+    "create_analyzer": "analyzer",
+    "create_japanese_analyzer": "analyzer",
+    "create_multilingual_analyzer": "analyzer",
     # Protocols
-    "LoggerProtocol",
-    "AnonymizerProtocol",
-    "TextExtractorProtocol",
-    "NullLogger",
-]
+    "LoggerProtocol": "protocols",
+    "AnonymizerProtocol": "protocols",
+    "TextExtractorProtocol": "protocols",
+    "NullLogger": "protocols",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
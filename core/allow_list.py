@@ -5,9 +5,53 @@ allow lists to Presidio analyzer to prevent false positives.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Relative dictionary paths in config are resolved from the project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Main term ends at the first /alias[ or /js[ suffix
+_SPLIT_RE = re.compile(r'/(?:alias|js)\[')
+# Pattern to extract aliases: /alias[term1|term2|term3]
+_ALIAS_RE = re.compile(r'/alias\[([^\]]+)\]')
+# Pattern to extract js variants: /js[term]
+_JS_RE = re.compile(r'/js\[([^\]]+)\]')
+
+
+@lru_cache(maxsize=8)
+def _parse_dictionary_cached(path_str: str, mtime_ns: int) -> tuple[str, ...]:
+    """
+    Parse a dictionary file once per (path, mtime).
+    
+    The mtime is part of the key so an edited file is re-read.
+    """
+    terms = []
+    
+    # Read and decode the whole file at once (dictionaries are small),
+    # rather than decoding line by line through a text-mode file.
+    data = Path(path_str).read_bytes().decode("utf-8")
+    
+    for line in data.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Extract main term (before any / suffix)
+        main_term = _SPLIT_RE.split(line, maxsplit=1)[0].strip()
+        if main_term:
+            terms.append(main_term)
+
+        # Extract aliases and js variants; either suffix may come first
+        for pattern in (_ALIAS_RE, _JS_RE):
+            match = pattern.search(line)
+            if match:
+                terms.extend([t for t in map(str.strip, match.group(1).split('|')) if t])
+    
+    # Remove duplicates while preserving order
+    return tuple(dict.fromkeys(terms))
+
 
 def parse_dictionary(path: str | Path) -> list[str]:
     """
@@ -18,55 +62,33 @@ def parse_dictionary(path: str | Path) -> list[str]:
     - With alias: "AI/alias[AI|Artificial Intelligence]"
     - With js suffix: "node.js/js[node]"
     
+    Parsed terms are cached per (resolved path, mtime), so repeated calls
+    for the same unchanged file do not re-read it.
+    
     Args:
         path: Path to the dictionary file
         
     Returns:
         List of all terms (main terms and aliases)
     """
-    terms = []
     path = Path(path)
     
-    if not path.exists():
-        return terms
-    
-    # Pattern to extract aliases: /alias[term1|term2|term3]
-    alias_pattern = re.compile(r'/alias\[([^\]]+)\]')
-    # Pattern to extract js variants: /js[term]
-    js_pattern = re.compile(r'/js\[([^\]]+)\]')
-    
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Extract main term (before any / suffix)
-            main_term = re.split(r'/(?:alias|js)\[', line)[0].strip()
-            if main_term:
-                terms.append(main_term)
-            
-            # Extract aliases
-            alias_match = alias_pattern.search(line)
-            if alias_match:
-                aliases = alias_match.group(1).split('|')
-                terms.extend(a.strip() for a in aliases if a.strip())
-            
-            # Extract js variants
-            js_match = js_pattern.search(line)
-            if js_match:
-                js_terms = js_match.group(1).split('|')
-                terms.extend(t.strip() for t in js_terms if t.strip())
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return []
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_terms = []
-    for term in terms:
-        if term not in seen:
-            seen.add(term)
-            unique_terms.append(term)
-    
-    return unique_terms
+    return list(_parse_dictionary_cached(str(path.resolve()), mtime_ns))
+
+
+@lru_cache(maxsize=4)
+def _allow_list_for(
+    dict_path: str,
+    mtime_ns: int,
+    additional: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Combine dictionary terms and additional terms once per input key."""
+    return (*_parse_dictionary_cached(dict_path, mtime_ns), *additional)
 
 
 def get_allow_list(config: dict[str, Any]) -> list[str]:
@@ -75,6 +97,8 @@ def get_allow_list(config: dict[str, Any]) -> list[str]:
     
     Reads the dictionary file path from config and parses it,
     then combines with any additional terms specified in config.
+    The combined list is cached per (dictionary path, mtime, additional
+    terms), so repeated calls with the same settings do no parsing.
     
     Args:
         config: Application configuration dictionary
@@ -87,20 +111,19 @@ def get_allow_list(config: dict[str, Any]) -> list[str]:
     if not allow_list_cfg.get("enabled", False):
         return []
     
-    terms = []
+    # Add any additional terms from config
+    additional = tuple(allow_list_cfg.get("additional_terms") or ())
     
-    # Parse dictionary file if specified
     dict_path = allow_list_cfg.get("dictionary_path")
-    if dict_path:
-        # Resolve relative paths from project root
-        path = Path(dict_path)
-        if not path.is_absolute():
-            path = Path(__file__).parent.parent / dict_path
-        terms.extend(parse_dictionary(path))
+    if not dict_path:
+        # No dictionary: nothing to resolve or stat
+        return list(additional)
     
-    # Add any additional terms from config
-    additional = allow_list_cfg.get("additional_terms", [])
-    if additional:
-        terms.extend(additional)
+    # Parse dictionary file, resolving relative paths from project root
+    path = _PROJECT_ROOT / dict_path
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return list(additional)
     
-    return terms
+    return list(_allow_list_for(str(path.resolve()), mtime_ns, additional))
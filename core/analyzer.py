@@ -4,20 +4,36 @@ This module provides functions to create AnalyzerEngine instances
 configured for different languages (English, Japanese, or multilingual).
 """
 
-import warnings
-from typing import Any
+from __future__ import annotations
 
-from presidio_analyzer import AnalyzerEngine
-from presidio_analyzer.nlp_engine import NlpEngineProvider
+import logging
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from recognizers.registry import GINZA_AVAILABLE, create_default_registry
+from core.cache_keys import freeze, thaw
+
+# Presidio and the recognizer registry (which pulls in spaCy/GiNZA support)
+# are imported inside the factories, so importing this module stays cheap
+# for callers that never build an analyzer.
+if TYPE_CHECKING:
+    from presidio_analyzer import AnalyzerEngine, RecognizerResult
+    from presidio_analyzer.nlp_engine import NlpEngine
+
+    from recognizers.registry import RecognizerRegistry
+
+logger = logging.getLogger(__name__)
 
 
 # Map spaCy / GiNZA NER labels to the entity labels used throughout this project.
 # Without this, Presidio will keep the raw labels (e.g., "Person", "Postal_Address")
 # which won't match our configured entities (e.g., "PERSON", "JP_ADDRESS").
-_NER_MODEL_CONFIGURATION: dict[str, Any] = {
-    "model_to_presidio_entity_mapping": {
+# Frozen (read-only views / tuples) so no caller can mutate the shared table;
+# _ner_model_configuration() hands Presidio plain copies.
+_NER_MODEL_CONFIGURATION: Mapping[str, Any] = MappingProxyType({
+    "model_to_presidio_entity_mapping": MappingProxyType({
         # spaCy (English)
         "PERSON": "PERSON",
         "PER": "PERSON",
@@ -37,18 +53,206 @@ _NER_MODEL_CONFIGURATION: dict[str, Any] = {
         "GPE_JP": "JP_ADDRESS",
         "Location": "JP_ADDRESS",
         "Date": "DATE",
-    },
+    }),
     # Keep defaults explicit to silence configuration warnings.
-    "low_score_entity_names": [],
-    "labels_to_ignore": [],
+    "low_score_entity_names": (),
+    "labels_to_ignore": (),
+})
+
+
+def _ner_model_configuration() -> dict[str, Any]:
+    """Plain dict/list copy of _NER_MODEL_CONFIGURATION for Presidio's validators."""
+    return {
+        key: dict(value) if isinstance(value, Mapping) else list(value)
+        for key, value in _NER_MODEL_CONFIGURATION.items()
+    }
+
+
+# spaCy components whose output Presidio never reads. NlpArtifacts only use
+# tokens, lemmas and entities, so the dependency parser (and GiNZA's bunsetu
+# recognizer, which depends on it) can be skipped. Tagger/attribute_ruler/
+# lemmatizer stay enabled: Presidio's context enhancer matches on lemmas.
+_DISABLED_COMPONENTS: dict[str, tuple[str, ...]] = {
+    "en_core_web_sm": ("parser",),
+    "en_core_web_md": ("parser",),
+    "en_core_web_lg": ("parser",),
+    "ja_ginza": ("parser", "bunsetu_recognizer"),
 }
 
 
+def disabled_components(model_name: str) -> tuple[str, ...]:
+    """spaCy components to disable when loading model_name (may be empty)."""
+    return _DISABLED_COMPONENTS.get(model_name, ())
+
+
+EN_MODEL = "en_core_web_lg"
+JA_MODEL_GINZA = "ja_ginza"
+
+# English spaCy model by size. "lg" is only needed when spaCy's own English
+# NER matters; as a tokenizer for pattern recognizers "sm" is ~15x smaller.
+# Only "lg" is part of the documented setup; the others are optional.
+_EN_MODELS_BY_SIZE: dict[str, str] = {
+    "sm": "en_core_web_sm",
+    "md": "en_core_web_md",
+    "lg": EN_MODEL,
+}
+
+
+def _en_model(nlp_size: str) -> str:
+    """Map an nlp_size ("sm" / "md" / "lg") to the English spaCy model name."""
+    try:
+        return _EN_MODELS_BY_SIZE[nlp_size]
+    except KeyError:
+        raise ValueError(
+            f"Unknown nlp_size '{nlp_size}' (expected one of {sorted(_EN_MODELS_BY_SIZE)})"
+        ) from None
+
+
+def _build_nlp_config(models: tuple[tuple[str, str], ...]) -> dict[str, Any]:
+    """
+    Expand hashable (lang_code, model_name) pairs into Presidio's nlp_configuration.
+    
+    The factories pass the tuple form around (it is the engine cache key);
+    the dict is only built at the boundary to NlpEngineProvider.
+    """
+    return {
+        "nlp_engine_name": "spacy",
+        "ner_model_configuration": _ner_model_configuration(),
+        "models": [
+            {
+                "lang_code": lang_code,
+                "model_name": model_name,
+                "disable": list(disabled_components(model_name)),
+            }
+            for lang_code, model_name in models
+        ],
+    }
+
+
+@lru_cache(maxsize=4)
+def get_nlp_engine(models: tuple[tuple[str, str], ...]) -> NlpEngine:
+    """
+    Create the spaCy NLP engine for a model set, once per process.
+    
+    Loading en_core_web_lg / ja_ginza takes seconds and hundreds of MB,
+    so every analyzer built with the same models shares one engine.
+    
+    Args:
+        models: (lang_code, model_name) pairs, e.g. (("en", "en_core_web_lg"),)
+        
+    Returns:
+        Loaded NlpEngine
+    """
+    from presidio_analyzer.nlp_engine import NlpEngineProvider
+
+    from core.nlp_engine import TrimmedSpacyNlpEngine
+
+    return NlpEngineProvider(
+        nlp_engines=(TrimmedSpacyNlpEngine,),
+        nlp_configuration=_build_nlp_config(models),
+    ).create_engine()
+
+
+@lru_cache(maxsize=4)
+def get_nlp_engine_or_none(models: tuple[tuple[str, str], ...]) -> NlpEngine | None:
+    """
+    Return get_nlp_engine(models), or None if the models cannot be loaded.
+    
+    Presidio downloads a missing spaCy model while loading it; if that or
+    the load itself fails, the failure is logged and remembered, so later
+    factory calls fall back to the basic engine without retrying the load.
+    """
+    try:
+        return get_nlp_engine(models)
+    except Exception as e:
+        names = ", ".join(name for _, name in models)
+        logger.warning(f"Failed to create NLP engine ({names}): {e}. Falling back to basic engine.")
+        return None
+
+
+@lru_cache(maxsize=8)
+def _cached_registry(
+    use_ginza: bool,
+    use_transformer: bool,
+    frozen_transformer_config: frozenset | None = None,
+) -> RecognizerRegistry:
+    """Build the default recognizer registry once per flag/config combination."""
+    from recognizers.registry import create_default_registry
+
+    return create_default_registry(
+        use_ginza=use_ginza,
+        use_transformer=use_transformer,
+        transformer_config=thaw(frozen_transformer_config)
+    )
+
+
+def get_registry(
+    use_ginza: bool,
+    use_transformer: bool,
+    transformer_config: dict[str, Any] | None,
+) -> RecognizerRegistry:
+    """
+    Return a recognizer registry, reusing one built by an earlier factory call.
+    
+    Recognizer construction compiles every regex pattern (and sets up ML
+    recognizers), so registries are shared across analyzers. apply_to_analyzer
+    only reads the registry, and the recognizers themselves are stateless
+    between analyze() calls, so sharing is safe.
+    """
+    return _cached_registry(use_ginza, use_transformer, freeze(transformer_config))
+
+
+def _ja_model(use_ginza: bool, fallback: str) -> str:
+    """Model for the "ja" slot: GiNZA when requested and installed, else fallback."""
+    from recognizers.registry import GINZA_AVAILABLE
+
+    return JA_MODEL_GINZA if use_ginza and GINZA_AVAILABLE else fallback
+
+
+def _bilingual_models(use_ginza: bool, nlp_size: str = "lg") -> tuple[tuple[str, str], ...]:
+    """
+    Decide the (lang_code, model_name) pairs for an en+ja engine up front.
+    
+    Without GiNZA (not requested or not installed) the "ja" slot reuses the
+    English model, which TrimmedSpacyNlpEngine then loads only once.
+    """
+    en_model = _en_model(nlp_size)
+    return (("en", en_model), ("ja", _ja_model(use_ginza, fallback=en_model)))
+
+
+# Short text hitting the phone pattern and both tokenizers.
+_WARMUP_TEXT = {
+    "ja": "ウォームアップ 123-4567-8901",
+    "en": "Warm-up call to 123-4567-8901",
+}
+
+
+def _warm_up(analyzer: AnalyzerEngine, languages: list[str]) -> None:
+    """
+    Run one throwaway analyze() per language.
+    
+    The first real call otherwise pays one-time costs (thinc/BLAS buffer
+    allocation, spaCy vocab growth, cuDNN kernel selection on GPU).
+    Failures are ignored so warm-up never breaks analyzer construction.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.backends.cudnn.benchmark = True
+
+    for language in languages:
+        try:
+            analyzer.analyze(text=_WARMUP_TEXT.get(language, _WARMUP_TEXT["en"]), language=language)
+        except Exception as e:
+            logger.warning(f"Analyzer warm-up failed for '{language}': {e}")
+
+
 def create_japanese_analyzer(
     use_ginza: bool = True,
     use_transformer: bool = False,
     transformer_config: dict[str, Any] | None = None,
-    verbose: bool = False
+    verbose: bool = False,
+    nlp_size: str | None = None,
+    warmup: bool = False
 ) -> AnalyzerEngine:
     """
     Create an AnalyzerEngine configured for Japanese text.
@@ -63,35 +267,35 @@ def create_japanese_analyzer(
         use_transformer: Whether to use Transformer-based NER
         transformer_config: Configuration for Transformer recognizers
         verbose: If True, print registry summary
+        nlp_size: English spaCy model size ("sm", "md", "lg"). Defaults to "sm"
+            when only pattern recognizers are active (no GiNZA, no Transformer),
+            falling back to "lg" if the small model cannot be loaded;
+            otherwise "lg".
+        warmup: If True, run a dummy analyze() so the first real call is fast
     
     Returns:
         Configured AnalyzerEngine for Japanese
     """
+    from presidio_analyzer import AnalyzerEngine
+
+    from recognizers.registry import GINZA_AVAILABLE
+
+    prefer_small = nlp_size is None and not (use_ginza and GINZA_AVAILABLE) and not use_transformer
+    if nlp_size is None:
+        nlp_size = "sm" if prefer_small else "lg"
+
     # Create registry
-    registry = create_default_registry(
-        use_ginza=use_ginza,
-        use_transformer=use_transformer,
-        transformer_config=transformer_config
-    )
+    registry = get_registry(use_ginza, use_transformer, transformer_config)
 
     if verbose:
         print(registry.summary())
 
-    # Create NLP configuration for Japanese
-    nlp_configuration = {
-        "nlp_engine_name": "spacy",
-        "ner_model_configuration": _NER_MODEL_CONFIGURATION,
-        "models": [
-            {"lang_code": "en", "model_name": "en_core_web_lg"},
-            {"lang_code": "ja", "model_name": "ja_ginza" if use_ginza and GINZA_AVAILABLE else "en_core_web_lg"},
-        ],
-    }
-
-    try:
-        nlp_engine = NlpEngineProvider(nlp_configuration=nlp_configuration).create_engine()
-    except (ImportError, OSError, ValueError) as e:
-        warnings.warn(f"Failed to create Japanese NLP engine: {e}. Falling back to basic engine.")
-        nlp_engine = None
+    # Shared NLP engine for Japanese
+    models = _bilingual_models(use_ginza, nlp_size)
+    nlp_engine = get_nlp_engine_or_none(models)
+    if nlp_engine is None and prefer_small:
+        # en_core_web_sm is optional; the documented setup only has en_core_web_lg
+        nlp_engine = get_nlp_engine_or_none(_bilingual_models(use_ginza, "lg"))
 
     # Create analyzer with Japanese support
     if nlp_engine:
@@ -105,6 +309,9 @@ def create_japanese_analyzer(
     # Apply recognizers from registry (Japanese only)
     registry.apply_to_analyzer(analyzer, language="ja")
 
+    if warmup:
+        _warm_up(analyzer, ["ja"])
+
     if verbose:
         ja_count = len(registry.get_by_language("ja"))
         print(f"✓ Japanese analyzer created with {ja_count} recognizers")
@@ -117,7 +324,9 @@ def create_analyzer(
     use_ginza: bool = True,
     use_transformer: bool = False,
     transformer_config: dict[str, Any] | None = None,
-    verbose: bool = False
+    verbose: bool = False,
+    nlp: bool = True,
+    nlp_size: str | None = None
 ) -> AnalyzerEngine:
     """
     Create an AnalyzerEngine for the specified language.
@@ -128,47 +337,62 @@ def create_analyzer(
         use_transformer: Whether to use Transformer-based NER
         transformer_config: Configuration for Transformer recognizers
         verbose: If True, print registry summary
+        nlp: If False, skip loading any spaCy model and run pattern
+            recognizers only (ignores use_ginza / use_transformer)
+        nlp_size: English spaCy model size ("sm", "md", "lg"); None keeps each
+            factory's default
         
     Returns:
         Configured AnalyzerEngine
     """
+    from presidio_analyzer import AnalyzerEngine
+
+    if not nlp:
+        return _create_pattern_only_analyzer(language)
+
     if language == "ja":
         return create_japanese_analyzer(
             use_ginza=use_ginza,
             use_transformer=use_transformer,
             transformer_config=transformer_config,
-            verbose=verbose
+            verbose=verbose,
+            nlp_size=nlp_size
         )
     # English analyzer with optional Transformer support
     elif use_transformer:
-        registry = create_default_registry(
-            use_ginza=False,
-            use_transformer=True,
-            transformer_config=transformer_config
-        )
+        registry = get_registry(False, True, transformer_config)
         analyzer = AnalyzerEngine()
         registry.apply_to_analyzer(analyzer, language="en")
         return analyzer
     else:
-        nlp_configuration = {
-            "nlp_engine_name": "spacy",
-            "ner_model_configuration": _NER_MODEL_CONFIGURATION,
-            "models": [
-                {"lang_code": "en", "model_name": "en_core_web_lg"},
-            ],
-        }
-        try:
-            nlp_engine = NlpEngineProvider(nlp_configuration=nlp_configuration).create_engine()
+        nlp_engine = get_nlp_engine_or_none((("en", _en_model(nlp_size or "lg")),))
+        if nlp_engine:
             return AnalyzerEngine(nlp_engine=nlp_engine, supported_languages=["en"])
-        except Exception:
-            return AnalyzerEngine()
+        return AnalyzerEngine()
+
+
+def _create_pattern_only_analyzer(language: str) -> AnalyzerEngine:
+    """Create an analyzer backed by NoOpNlpEngine (no spaCy model is loaded)."""
+    from presidio_analyzer import AnalyzerEngine
+
+    from core.nlp_engine import NoOpNlpEngine
+
+    analyzer = AnalyzerEngine(
+        nlp_engine=NoOpNlpEngine(languages=[language]),
+        supported_languages=[language]
+    )
+    registry = get_registry(False, False, None)
+    registry.apply_to_analyzer(analyzer, language=language, types=["pattern"])
+    return analyzer
 
 
 def create_multilingual_analyzer(
     use_ginza: bool = True,
     use_transformer: bool = False,
     transformer_config: dict[str, Any] | None = None,
-    verbose: bool = False
+    verbose: bool = False,
+    nlp_size: str = "lg",
+    warmup: bool = False
 ) -> AnalyzerEngine:
     """
     Create an AnalyzerEngine that supports both English and Japanese text.
@@ -181,36 +405,25 @@ def create_multilingual_analyzer(
         use_transformer: Whether to use Transformer-based NER
         transformer_config: Configuration for Transformer recognizers
         verbose: If True, print registry summary
+        nlp_size: English spaCy model size ("sm", "md", "lg"). English text is
+            analyzed with spaCy's own NER here, so "lg" is the default.
+        warmup: If True, run a dummy analyze() per language so the first real call is fast
         
     Returns:
         Configured AnalyzerEngine supporting both 'en' and 'ja'
     """
+    from presidio_analyzer import AnalyzerEngine
+
     # Create registry with all recognizers
-    registry = create_default_registry(
-        use_ginza=use_ginza,
-        use_transformer=use_transformer,
-        transformer_config=transformer_config
-    )
+    registry = get_registry(use_ginza, use_transformer, transformer_config)
 
     if verbose:
         print("=== Multilingual Analyzer Configuration ===")
         print(registry.summary())
 
-    # Configure NLP engine with both language models
-    nlp_configuration = {
-        "nlp_engine_name": "spacy",
-        "ner_model_configuration": _NER_MODEL_CONFIGURATION,
-        "models": [
-            {"lang_code": "en", "model_name": "en_core_web_lg"},
-            {"lang_code": "ja", "model_name": "ja_ginza" if use_ginza and GINZA_AVAILABLE else "en_core_web_lg"},
-        ],
-    }
-
-    try:
-        nlp_engine = NlpEngineProvider(nlp_configuration=nlp_configuration).create_engine()
-    except Exception as e:
-        warnings.warn(f"Failed to create multi-language NLP engine: {e}. Falling back to basic engine.")
-        nlp_engine = None
+    # Shared NLP engine with both language models
+    models = _bilingual_models(use_ginza, nlp_size)
+    nlp_engine = get_nlp_engine_or_none(models)
 
     # Create analyzer with both language support
     if nlp_engine:
@@ -224,7 +437,45 @@ def create_multilingual_analyzer(
     # Apply ALL recognizers from registry (no double-registration)
     registry.apply_to_analyzer(analyzer)
 
+    if warmup:
+        _warm_up(analyzer, ["ja", "en"])
+
     if verbose:
         print(f"✓ Multilingual analyzer created with {len(registry.configs)} recognizers")
 
     return analyzer
+
+
+def analyze_batch(
+    analyzer: AnalyzerEngine,
+    texts: list[str],
+    language: str,
+    batch_size: int = 32,
+    **analyze_kwargs: Any
+) -> list[list[RecognizerResult]]:
+    """
+    Analyze many texts with one engine, running spaCy over them in batches.
+    
+    The NLP engine processes all texts through nlp.pipe() up front, and the
+    resulting NlpArtifacts are handed to analyze() so each text is not
+    tokenized a second time.
+    
+    Args:
+        analyzer: AnalyzerEngine (e.g. from create_multilingual_analyzer)
+        texts: Texts to analyze
+        language: Language code of all texts ("en" or "ja")
+        batch_size: Number of texts per nlp.pipe() batch
+        **analyze_kwargs: Forwarded to analyzer.analyze (entities, allow_list, ...)
+        
+    Returns:
+        One result list per input text, in input order
+    """
+    artifacts = analyzer.nlp_engine.process_batch(
+        texts, language=language, batch_size=batch_size
+    )
+    return [
+        analyzer.analyze(
+            text=text, language=language, nlp_artifacts=nlp_artifacts, **analyze_kwargs
+        )
+        for text, nlp_artifacts in artifacts
+    ]
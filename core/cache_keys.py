@@ -0,0 +1,33 @@
+"""Hashable cache keys for configuration values.
+
+Factories cached with functools.lru_cache need hashable arguments, but
+configs are plain dicts and lists loaded from YAML. freeze turns such a
+value into a hashable key and thaw rebuilds the original inside the
+cached function.
+"""
+
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """
+    Convert a config value into a hashable cache key.
+
+    Dicts become frozensets of (key, value) pairs and lists become tuples,
+    recursively. Config values come from YAML (dict / list / scalars), so
+    thaw can reverse this unambiguously.
+    """
+    if isinstance(value, dict):
+        return frozenset((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of freeze: rebuild dicts and lists from a frozen key."""
+    if isinstance(value, frozenset):
+        return {k: thaw(v) for k, v in value}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
@@ -2,39 +2,48 @@
 
 This module provides:
 - Masker class: Core masking with dependency injection
-- PIIMasker class: Backward-compatible wrapper (deprecated)
-- mask_pii_in_text function: Backward-compatible function (deprecated)
+- build_operators / fast_replace: Mask operators and direct span replacement
 
 Layer: Domain
 Dependencies: Protocols from core.protocols
 """
 
 import re
-
-from datetime import datetime
+import time
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+from presidio_analyzer import AnalyzerEngine
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import OperatorConfig
 
 from config import (
     get_detection_strategy,
-    get_entities_to_mask,
-    get_entity_categories,
+    get_nlp_model_size,
     get_transformer_config,
     load_config,
 )
 from core.allow_list import get_allow_list
-from core.analyzer import create_analyzer, create_multilingual_analyzer
-from core.masking_result import MaskingResult
-from core.processors.hybrid_detection import hybrid_detection_analyze
+from core.analyzer import analyze_batch, create_analyzer, create_multilingual_analyzer
+from core.cache_keys import freeze
+from core.masking_result import EntityInfo, MaskingResult, entities_from_results
+from core.processors.hybrid_detection import (
+    hybrid_detection_analyze,
+    hybrid_detection_analyze_batch,
+)
 from core.processors.result import deduplicate_results, merge_results
 from core.processors.text import preprocess_text
 from core.protocols import AnonymizerProtocol, LoggerProtocol, NullLogger
 
-
+_PERSON_TYPES = frozenset({"JP_PERSON", "PERSON"})
 _PERSON_TEXT_RE = re.compile(r"[A-Za-z\u3040-\u30FF\u4E00-\u9FFF]")
 
+# Every supported entity contains at least one letter or digit (Latin, kana,
+# kanji, full-width); text without one cannot hold PII, so analysis is skipped.
+_PII_PROBE_RE = re.compile(r"[^\W_]")
+
 
 def _is_meaningful_entity(entity_text: str, entity_type: str) -> bool:
     """Best-effort filter to drop obvious garbage entities.
@@ -43,43 +52,142 @@ def _is_meaningful_entity(entity_text: str, entity_type: str) -> bool:
     can be falsely tagged as a person by NER. Those inflate counts and cause
     downstream masking/logging noise.
     """
-    if not entity_text:
-        return False
-    stripped = entity_text.strip()
-    if not stripped:
+    # Empty or whitespace-only (same test as .strip(), without the copy)
+    if not entity_text or entity_text.isspace():
         return False
 
-    if entity_type in {"JP_PERSON", "PERSON"}:
-        # Require at least one plausible name character.
-        if not _PERSON_TEXT_RE.search(stripped):
-            return False
+    if entity_type in _PERSON_TYPES:
+        # Require at least one plausible name character. Whitespace never
+        # matches, so searching the unstripped text gives the same answer.
+        return _PERSON_TEXT_RE.search(entity_text) is not None
 
     return True
 
 
-def build_operators(config: dict[str, Any]) -> dict:
+@lru_cache(maxsize=8)
+def _get_analyzer(
+    language: str,
+    use_ginza: bool = True,
+    use_transformer: bool = False,
+    nlp_size: str | None = None
+) -> AnalyzerEngine:
+    """Return an AnalyzerEngine for the language, built once per process.
+
+    AnalyzerEngine construction loads Presidio's predefined recognizers and
+    the spaCy/GiNZA engine, so analyzers are shared across Masker calls
+    and instances instead of being rebuilt for every text.
+    """
+    if language == "auto":
+        return create_multilingual_analyzer(
+            use_ginza=use_ginza, use_transformer=use_transformer, nlp_size=nlp_size or "lg"
+        )
+    return create_analyzer(
+        language=language, use_ginza=use_ginza, use_transformer=use_transformer, nlp_size=nlp_size
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_anonymizer() -> AnonymizerEngine:
+    """Return the shared AnonymizerEngine (stateless between calls)."""
+    return AnonymizerEngine()
+
+
+@lru_cache(maxsize=8)
+def _build_operators_cached(
+    default_mask: str,
+    entity_masks: tuple[tuple[str, str], ...]
+) -> Mapping[str, OperatorConfig]:
+    """Build the operator mapping once per (default_mask, entity_masks) pair.
+
+    Returned as a read-only view: the mapping is shared by every caller,
+    and AnonymizerEngine only reads it (DEFAULT is always present, so it
+    never adds one).
+    """
+    operators = {
+        "DEFAULT": OperatorConfig("replace", {"new_value": default_mask})
+    }
+    for entity_type, mask in entity_masks:
+        operators[entity_type] = OperatorConfig("replace", {"new_value": mask})
+    return MappingProxyType(operators)
+
+
+def build_operators(config: dict[str, Any]) -> Mapping[str, OperatorConfig]:
     """
     Build anonymizer operators from config.
     
     Reads masking.entity_masks from config.yaml to create entity-specific
     mask patterns (e.g., phone: ***-****-****, zip: ***-****).
+    The result is memoized on the masking settings, so maskers sharing a
+    config share one read-only mapping.
     
     Args:
         config: Configuration dictionary
         
     Returns:
-        Dict of entity_type -> OperatorConfig for AnonymizerEngine
+        Read-only mapping of entity_type -> OperatorConfig for AnonymizerEngine
     """
     masking_cfg = config.get("masking", {})
     default_mask = masking_cfg.get("default_mask", "****")
     entity_masks = masking_cfg.get("entity_masks", {})
     
-    operators = {
-        "DEFAULT": OperatorConfig("replace", {"new_value": default_mask})
-    }
-    for entity_type, mask in entity_masks.items():
-        operators[entity_type] = OperatorConfig("replace", {"new_value": mask})
-    return operators
+    return _build_operators_cached(default_mask, tuple(entity_masks.items()))
+
+
+# Gap between two same-type entities that AnonymizerEngine merges into one
+# span (its _merge_entities_with_spaces_between pattern, kept verbatim)
+_SPACES_BETWEEN_RE = re.compile(r"^( )+$")
+
+
+def fast_replace(
+    text: str,
+    results: list,
+    operators: Mapping[str, OperatorConfig]
+) -> str | None:
+    """
+    Apply "replace" operators to detected spans without AnonymizerEngine.
+    
+    Produces the same text as AnonymizerEngine.anonymize for the results
+    Masker hands it (non-empty, non-overlapping spans): same-type entities
+    separated only by spaces are merged into one replacement, the entity's
+    operator falls back to DEFAULT, and an empty new_value becomes
+    "<ENTITY_TYPE>". The output is assembled in one left-to-right join.
+    
+    Args:
+        text: Original text
+        results: RecognizerResult list
+        operators: entity_type -> OperatorConfig (see build_operators)
+        
+    Returns:
+        Masked text, or None if the input needs the full engine
+        (overlapping or empty spans, or an operator other than "replace")
+    """
+    # [start, end, entity_type] per replacement, after whitespace merging
+    spans: list[list] = []
+    for r in sorted(results, key=lambda r: (r.start, r.end)):
+        if r.start >= r.end or (spans and r.start < spans[-1][1]):
+            return None
+        if (
+            spans and spans[-1][2] == r.entity_type
+            and _SPACES_BETWEEN_RE.search(text[spans[-1][1]:r.start])
+        ):
+            spans[-1][1] = r.end
+        else:
+            spans.append([r.start, r.end, r.entity_type])
+    
+    pieces = []
+    pos = 0
+    for start, end, entity_type in spans:
+        operator = operators.get(entity_type) or operators.get("DEFAULT")
+        if operator is None or operator.operator_name != "replace":
+            return None
+        new_value = operator.params.get("new_value")
+        if not isinstance(new_value, str | None):
+            return None
+        pieces.append(text[pos:start])
+        pieces.append(new_value or f"<{entity_type}>")
+        pos = end
+    pieces.append(text[pos:])
+    return "".join(pieces)
 
 
 class Masker:
@@ -110,24 +218,39 @@ class Masker:
         self,
         anonymizer: AnonymizerProtocol | None = None,
         logger: LoggerProtocol | None = None,
-        config: dict[str, Any] | None = None
+        config: dict[str, Any] | None = None,
+        use_fast_replace: bool = True
     ):
         """Initialize masker with dependencies.
         
         Args:
-            anonymizer: Anonymizer implementation (default: AnonymizerEngine)
+            anonymizer: Anonymizer implementation (default: shared AnonymizerEngine)
             logger: Logger implementation (default: NullLogger)
             config: Configuration dict (default: load from config.yaml)
+            use_fast_replace: With the default anonymizer, replace spans
+                directly (fast_replace) instead of calling AnonymizerEngine.
+                Ignored when an anonymizer is injected.
         """
-        self.anonymizer = anonymizer or AnonymizerEngine()
+        self._fast_replace = use_fast_replace and anonymizer is None
+        self.anonymizer = anonymizer or _get_anonymizer()
         self.logger = logger or NullLogger()
         self.config = config or load_config()
         
         # Cache config values
         self._transformer_cfg = get_transformer_config(self.config)
+        # Hashable key for the hybrid path's ML recognizer cache, built once
+        self._frozen_config = freeze(self.config)
+        self._nlp_size = get_nlp_model_size(self.config)
         self._detection_strategy = get_detection_strategy(self.config)
         self._operators = build_operators(self.config)
         self._allow_list = get_allow_list(self.config)
+        
+        # Entities for the rule-based / spaCy / GiNZA path, ordered and
+        # de-duplicated once here rather than on every analyze() call.
+        self._all_entities = list(dict.fromkeys([
+            *self._detection_strategy.get("pattern_entities", []),
+            *self._detection_strategy.get("transformer_entities", []),
+        ]))
     
     def analyze(
         self,
@@ -148,6 +271,10 @@ class Masker:
         if do_preprocess:
             text = preprocess_text(text)
         
+        # Cheap pre-check before running NER on boilerplate/blank pages
+        if not _PII_PROBE_RE.search(text):
+            return []
+        
         use_transformer = self._transformer_cfg.get("enabled", False)
         transformer_entities = self._detection_strategy.get("transformer_entities", [])
         pattern_entities = self._detection_strategy.get("pattern_entities", [])
@@ -158,16 +285,16 @@ class Masker:
                 transformer_entities=transformer_entities,
                 pattern_entities=pattern_entities,
                 language=language,
-                app_config=self.config,
+                frozen_app_config=self._frozen_config,
                 allow_list=self._allow_list
             )
         else:
             # When ML detection is disabled, fall back to rule-based / spaCy / GiNZA
             # for *all* entities to avoid dropping PERSON/ADDRESS/etc.
-            all_entities = list(dict.fromkeys([*pattern_entities, *transformer_entities]))
+            all_entities = self._all_entities
             
             if language == "auto":
-                analyzer = create_multilingual_analyzer(use_ginza=True, use_transformer=False)
+                analyzer = _get_analyzer("auto", nlp_size=self._nlp_size)
                 results_en = analyzer.analyze(
                     text=text, language="en", entities=all_entities, allow_list=self._allow_list
                 )
@@ -176,15 +303,74 @@ class Masker:
                 )
                 results = merge_results(results_en, results_ja)
             else:
-                analyzer = create_analyzer(language=language, use_transformer=False)
+                analyzer = _get_analyzer(language, nlp_size=self._nlp_size)
                 results = analyzer.analyze(
                     text=text, language=language, entities=all_entities, allow_list=self._allow_list
                 )
         
-        results = [
-            r for r in results
-            if _is_meaningful_entity(text[r.start:r.end], getattr(r, "entity_type", ""))
-        ]
+        return self._postprocess_results(text, results)
+    
+    def analyze_batch(
+        self,
+        texts: list[str],
+        language: str = "auto"
+    ) -> list[list]:
+        """Analyze several texts, running the models over them in batches.
+        
+        Gives the same results as calling analyze() per text, but the
+        rule-based / spaCy / GiNZA path tokenizes all texts with one
+        nlp.pipe() pass per language (see core.analyzer.analyze_batch), and
+        the hybrid path runs Transformer NER over padded batches of texts
+        (see hybrid_detection_analyze_batch).
+        
+        Args:
+            texts: Texts to analyze
+            language: Language code ("en", "ja", or "auto")
+            
+        Returns:
+            One list of RecognizerResult per input text, in input order
+        """
+        # Only texts passing the cheap PII pre-check go through the models
+        batch_results: list[list] = [[] for _ in texts]
+        candidates = [i for i, text in enumerate(texts) if _PII_PROBE_RE.search(text)]
+        if not candidates:
+            return batch_results
+        texts = [texts[i] for i in candidates]
+        
+        all_entities = self._all_entities
+        
+        if self._transformer_cfg.get("enabled", False):
+            batch = hybrid_detection_analyze_batch(
+                texts=texts,
+                transformer_entities=self._detection_strategy.get("transformer_entities", []),
+                pattern_entities=self._detection_strategy.get("pattern_entities", []),
+                language=language,
+                frozen_app_config=self._frozen_config,
+                allow_list=self._allow_list
+            )
+        elif language == "auto":
+            analyzer = _get_analyzer("auto", nlp_size=self._nlp_size)
+            results_en = analyze_batch(
+                analyzer, texts, "en", entities=all_entities, allow_list=self._allow_list
+            )
+            results_ja = analyze_batch(
+                analyzer, texts, "ja", entities=all_entities, allow_list=self._allow_list
+            )
+            batch = [merge_results(en, ja) for en, ja in zip(results_en, results_ja, strict=True)]
+        else:
+            analyzer = _get_analyzer(language, nlp_size=self._nlp_size)
+            batch = analyze_batch(
+                analyzer, texts, language, entities=all_entities, allow_list=self._allow_list
+            )
+        
+        for i, text, results in zip(candidates, texts, batch, strict=True):
+            batch_results[i] = self._postprocess_results(text, results)
+        return batch_results
+    
+    def _postprocess_results(self, text: str, results: list) -> list:
+        """Drop garbage entities and resolve overlaps."""
+        is_meaningful = _is_meaningful_entity
+        results = [r for r in results if is_meaningful(text[r.start:r.end], r.entity_type)]
         return deduplicate_results(results, text)
     
     def mask(
@@ -192,7 +378,8 @@ class Masker:
         text: str,
         language: str = "auto",
         do_preprocess: bool = False,
-        log_results: bool = True
+        log_results: bool = True,
+        analyzer_results: list | None = None
     ) -> MaskingResult:
         """Mask PII in text.
         
@@ -201,51 +388,70 @@ class Masker:
             language: Language code ("en", "ja", or "auto")
             do_preprocess: If True, normalize text before analysis
             log_results: If True, log detected entities
+            analyzer_results: Results already computed for this text (e.g. by
+                analyze_batch); when given, analysis is skipped
             
         Returns:
             MaskingResult with masked text and entity info
         """
-        # Preprocess if requested
+        # Precomputed results refer to the raw text, so they are only
+        # usable when no preprocessing is requested
         if do_preprocess:
             text = preprocess_text(text)
-            # Don't preprocess again in analyze
-            results = self.analyze(text, language, do_preprocess=False)
-        else:
-            results = self.analyze(text, language, do_preprocess=False)
+            analyzer_results = None
+        results = (
+            analyzer_results if analyzer_results is not None
+            else self.analyze(text, language, do_preprocess=False)
+        )
+        
+        # Nothing detected: the text is returned unchanged
+        if not results:
+            return MaskingResult(masked_text=text)
+        
+        # Read each result (and slice its text) once; the log and the
+        # MaskingResult both use these records
+        entities = entities_from_results(text, results)
         
         # Log results
-        if log_results and results:
-            self._log_results(text, results)
-        
-        # Anonymize
-        anonymized = self.anonymizer.anonymize(
-            text=text,
-            analyzer_results=results,
-            operators=self._operators,
-        )
+        if log_results:
+            self.log_entities(entities)
         
-        return MaskingResult.from_anonymizer_result(
-            anonymized_text=anonymized.text,
-            original_text=text,
-            analyzer_results=results
-        )
+        # Anonymize: direct span replacement when possible, else the engine
+        masked_text = fast_replace(text, results, self._operators) if self._fast_replace else None
+        if masked_text is None:
+            masked_text = self.anonymizer.anonymize(
+                text=text,
+                analyzer_results=results,
+                operators=self._operators,
+            ).text
+        
+        return MaskingResult.from_entities(masked_text, entities)
     
-    def _log_results(self, text: str, results: list) -> None:
+    def log_entities(self, entities: tuple[EntityInfo, ...]) -> None:
         """Log detected entities.
         
+        Skipped entirely when the logger reports enabled=False (NullLogger,
+        or a MaskingLogger with no handler to write to). Loggers without
+        an enabled attribute are always written to.
+        
         Args:
-            text: Original text
-            results: List of RecognizerResult
+            entities: EntityInfo per detected entity
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.log(f"\n{'='*60}")
-        self.logger.log(f"Masking Log - {timestamp}")
-        self.logger.log(f"{'='*60}")
-        for result in results:
-            entity_text = text[result.start:result.end]
-            self.logger.log(
-                f"[{result.entity_type}] \"{entity_text}\" "
-                f"(score: {result.score:.2f}, pos: {result.start}-{result.end})"
-            )
-        self.logger.log(f"Total: {len(results)} entities masked")
-
+        if not getattr(self.logger, "enabled", True):
+            return
+        
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        separator = "=" * 60
+        lines = [
+            f"\n{separator}",
+            f"Masking Log - {timestamp}",
+            separator,
+            *(
+                f"[{e.entity_type}] \"{e.text}\" "
+                f"(score: {e.score:.2f}, pos: {e.start}-{e.end})"
+                for e in entities
+            ),
+            f"Total: {len(entities)} entities masked",
+        ]
+        # One log record (one handler write/flush) per document, not per entity
+        self.logger.log("\n".join(lines))
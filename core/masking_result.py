@@ -3,14 +3,18 @@
 Provides immutable data classes for masking operation results.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityInfo:
     """Information about a single detected entity.
     
+    Slotted: documents can carry thousands of these, and slots drop the
+    per-instance __dict__.
+    
     Attributes:
         entity_type: Type of entity (e.g., "PERSON", "JP_ADDRESS")
         text: Original text that was detected
@@ -34,8 +38,32 @@ class EntityInfo:
             "end": self.end,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EntityInfo":
+        """Inverse of to_dict."""
+        return cls(data["type"], data["text"], data["score"], data["start"], data["end"])
 
-@dataclass(frozen=True)
+
+def entities_from_results(text: str, analyzer_results: list) -> tuple[EntityInfo, ...]:
+    """Read each RecognizerResult once into an EntityInfo record.
+    
+    The span text is sliced here, so the log and MaskingResult
+    can both read plain fields instead of re-slicing the text.
+    
+    Args:
+        text: Original text the results refer to
+        analyzer_results: List of RecognizerResult from analyzer
+        
+    Returns:
+        EntityInfo per result, in the same order
+    """
+    return tuple(
+        EntityInfo(r.entity_type, text[r.start:r.end], r.score, r.start, r.end)
+        for r in analyzer_results
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class MaskingStats:
     """Statistics about the masking operation.
     
@@ -82,31 +110,55 @@ class MaskingResult:
         Returns:
             MaskingResult instance
         """
-        entities = []
-        entities_by_type: dict[str, int] = {}
-        
-        for result in analyzer_results:
-            entity_text = original_text[result.start:result.end]
-            entities.append(EntityInfo(
-                entity_type=result.entity_type,
-                text=entity_text,
-                score=result.score,
-                start=result.start,
-                end=result.end,
-            ))
-            entities_by_type[result.entity_type] = entities_by_type.get(result.entity_type, 0) + 1
+        return cls.from_entities(
+            anonymized_text,
+            entities_from_results(original_text, analyzer_results)
+        )
+
+    @classmethod
+    def from_entities(
+        cls,
+        anonymized_text: str,
+        entities: tuple[EntityInfo, ...]
+    ) -> "MaskingResult":
+        """Create MaskingResult from already-built EntityInfo records.
         
+        Args:
+            anonymized_text: Text after anonymization
+            entities: EntityInfo per detected entity (see entities_from_results)
+            
+        Returns:
+            MaskingResult instance
+        """
         stats = MaskingStats(
             total_entities=len(entities),
-            entities_by_type=entities_by_type,
+            entities_by_type=dict(Counter(e.entity_type for e in entities)),
         )
         
         return cls(
             masked_text=anonymized_text,
-            entities=tuple(entities),
+            entities=entities,
             stats=stats,
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization.
+        
+        Stats are derived from the entities and are not stored.
+        """
+        return {
+            "masked_text": self.masked_text,
+            "entities": [e.to_dict() for e in self.entities],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MaskingResult":
+        """Rebuild a MaskingResult written by to_dict."""
+        return cls.from_entities(
+            data["masked_text"],
+            tuple(EntityInfo.from_dict(e) for e in data["entities"])
+        )
+
     def to_entities_info(self) -> list[dict[str, Any]] | None:
         """Convert entities to list of dicts for backward compatibility.
         
@@ -9,19 +9,58 @@ Layer: Application
 Depends on: Domain layer (Masker), Infrastructure layer (Protocols)
 """
 
+import hashlib
+import json
+import os
 import sys
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any
 
-from presidio_anonymizer import AnonymizerEngine
-
 from config import load_config
-from core.masker import Masker, build_operators
+from core.allow_list import get_allow_list
+from core.masker import Masker
 from core.masking_result import MaskingResult
-from core.processors.text import TextPreprocessor
 from core.protocols import LoggerProtocol, TextExtractorProtocol
 
+# Bump whenever detection code (recognizers, filters, merging) changes its
+# output, so results cached by an older version are not served.
+_CACHE_FORMAT = 1
+
+# Distributions whose version changes detection results: the Presidio and
+# NLP stacks, and the spaCy / GiNZA model packages themselves.
+_CACHE_VERSIONED_PACKAGES = (
+    "presidio-analyzer",
+    "presidio-anonymizer",
+    "spacy",
+    "ginza",
+    "ja-ginza",
+    "transformers",
+    "en-core-web-sm",
+    "en-core-web-md",
+    "en-core-web-lg",
+)
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def _cache_salt() -> list[Any]:
+    """Code, package and model identity mixed into every cache key."""
+    from recognizers.registry import GINZA_AVAILABLE, TRANSFORMER_AVAILABLE
+
+    return [
+        _CACHE_FORMAT,
+        {name: _package_version(name) for name in _CACHE_VERSIONED_PACKAGES},
+        GINZA_AVAILABLE,
+        TRANSFORMER_AVAILABLE,
+    ]
+
 
 class MaskingService:
     """Application service for file-based PII masking.
@@ -56,7 +95,8 @@ class MaskingService:
         self,
         extractor: TextExtractorProtocol,
         masker: Masker,
-        logger: LoggerProtocol
+        logger: LoggerProtocol,
+        cache_dir: Path | None = None
     ):
         """Initialize service with dependencies.
         
@@ -64,10 +104,17 @@ class MaskingService:
             extractor: Text extraction implementation
             masker: Masker instance for PII detection/masking
             logger: Logger implementation
+            cache_dir: Directory for cached MaskingResults (None = no cache).
+                Results are keyed on the extracted text, language, masker
+                config and package/model versions, so re-running on an
+                unchanged document skips analysis entirely. Cache files
+                hold the detected entity text, i.e. raw PII.
         """
         self.extractor = extractor
         self.masker = masker
         self.logger = logger
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._config_hash: str | None = None
     
     def process_file(
         self,
@@ -102,34 +149,260 @@ class MaskingService:
                 print(f"Warning: No text extracted from {input_path.name}.", file=sys.stderr)
                 return None
             
-            # 2) Mask PII
-            print(f"Analyzing and masking PII (language: {language})...", file=sys.stderr)
-            result = self.masker.mask(text, language=language, log_results=True)
+            # 2) Mask PII (or reuse the cached result for this exact text)
+            result = self._load_cached(text, language)
+            if result is None:
+                print(f"Analyzing and masking PII (language: {language})...", file=sys.stderr)
+                result = self.masker.mask(text, language=language, log_results=True)
+                self._store_cached(text, language, result)
+            elif result.entities:
+                self.masker.log_entities(result.entities)
             
-            # 3) Show detected entities if verbose
-            if verbose and result.entities:
-                print(f"\n[{input_path.name}] Detected PII Entities:", file=sys.stderr)
-                for i, entity in enumerate(result.entities, 1):
-                    print(
-                        f"{i}. {entity.entity_type}: '{entity.text}' (score: {entity.score:.2f})",
-                        file=sys.stderr
-                    )
-                print(f"Total: {len(result.entities)} entities detected", file=sys.stderr)
-            
-            # 4) Output masked text
-            if output_path:
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(result.masked_text)
-                print(f"Masked text saved to {output_path}", file=sys.stderr)
-            else:
-                print("\n=== Masked Text ===", file=sys.stderr)
-                print(result.masked_text)
+            # 3) Show entities and 4) output masked text
+            self._emit(input_path, output_path, result, verbose)
             
             return result
             
         except Exception as e:
             print(f"Error processing {input_path.name}: {e}", file=sys.stderr)
             return None
+        finally:
+            self._flush_log()
+    
+    def process_files(
+        self,
+        jobs: list[tuple[Path, Path, Path]],
+        language: str = "auto",
+        verbose: bool = False
+    ) -> list[MaskingResult | None]:
+        """Process several files, analyzing all their texts in one batch.
+        
+        Text is extracted from every file first (two files at a time on a
+        thread pool), then analyzed together via
+        Masker.analyze_batch (one spaCy nlp.pipe pass per language instead
+        of one pipeline run per file), then each file is masked, logged and
+        saved as in process_file.
+        
+        Args:
+            jobs: (input_path, output_path, log_path) per file
+            language: Language code ("en", "ja", or "auto")
+            verbose: If True, print detected entities
+            
+        Returns:
+            One MaskingResult (or None on failure / empty text) per job
+        """
+        results: list[MaskingResult | None] = [None] * len(jobs)
+        
+        # 1) Extract text from every document
+        texts = self._extract_texts(jobs)
+        
+        # Documents seen before with the same config are served from the cache
+        self._serve_cached(jobs, texts, results, language, verbose)
+        
+        # 2) Analyze the rest in one batch and 3) mask, log and save them
+        if texts:
+            self._mask_batch(jobs, texts, results, language, verbose)
+        
+        self._flush_log()
+        return results
+    
+    def _extract_texts(self, jobs: list[tuple[Path, Path, Path]]) -> dict[int, str]:
+        """Extract the text of every job, keyed by job index.
+        
+        Extractions are submitted to a small thread pool so reading the next
+        file from disk overlaps with parsing the current one; results are
+        consumed in job order. Failed and empty extractions are reported and
+        left out.
+        """
+        texts: dict[int, str] = {}
+        with ThreadPoolExecutor(max_workers=2) as reader:
+            extractions = [
+                reader.submit(self.extractor.extract, str(input_path))
+                for input_path, _, _ in jobs
+            ]
+            for i, ((input_path, _, _), extraction) in enumerate(
+                zip(jobs, extractions, strict=True)
+            ):
+                try:
+                    print(f"Extracting text from {input_path.name}...", file=sys.stderr)
+                    text = extraction.result()
+                except Exception as e:
+                    print(f"Error processing {input_path.name}: {e}", file=sys.stderr)
+                    continue
+                if not text.strip():
+                    print(f"Warning: No text extracted from {input_path.name}.", file=sys.stderr)
+                    continue
+                texts[i] = text
+        return texts
+    
+    def _serve_cached(
+        self,
+        jobs: list[tuple[Path, Path, Path]],
+        texts: dict[int, str],
+        results: list[MaskingResult | None],
+        language: str,
+        verbose: bool
+    ) -> None:
+        """Log and emit every cache hit, removing it from texts."""
+        for i in list(texts):
+            cached = self._load_cached(texts[i], language)
+            if cached is None:
+                continue
+            input_path, output_path, log_path = jobs[i]
+            try:
+                if log_path:
+                    self.logger.setup_file_handler(log_path)
+                if cached.entities:
+                    self.masker.log_entities(cached.entities)
+                self._emit(input_path, output_path, cached, verbose)
+                results[i] = cached
+            except Exception as e:
+                print(f"Error processing {input_path.name}: {e}", file=sys.stderr)
+            del texts[i]
+    
+    def _mask_batch(
+        self,
+        jobs: list[tuple[Path, Path, Path]],
+        texts: dict[int, str],
+        results: list[MaskingResult | None],
+        language: str,
+        verbose: bool
+    ) -> None:
+        """Analyze texts in one batch, then mask, log and save each job.
+        
+        Output files are written on a small thread pool so disk I/O
+        overlaps with masking the next document.
+        """
+        print(
+            f"Analyzing PII in {len(texts)} documents (language: {language})...",
+            file=sys.stderr
+        )
+        indices = list(texts)
+        batch = self.masker.analyze_batch([texts[i] for i in indices], language=language)
+        
+        writes: list[tuple[Path, Future]] = []
+        with ThreadPoolExecutor(max_workers=4) as writer:
+            for i, analyzer_results in zip(indices, batch, strict=True):
+                input_path, output_path, log_path = jobs[i]
+                try:
+                    if log_path:
+                        self.logger.setup_file_handler(log_path)
+                    result = self.masker.mask(
+                        texts[i], language=language, log_results=True,
+                        analyzer_results=analyzer_results
+                    )
+                    future = self._emit(input_path, output_path, result, verbose, writer=writer)
+                    if future is not None:
+                        writes.append((input_path, future))
+                    results[i] = result
+                    self._store_cached(texts[i], language, result)
+                except Exception as e:
+                    print(f"Error processing {input_path.name}: {e}", file=sys.stderr)
+        
+        for input_path, future in writes:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error writing output for {input_path.name}: {e}", file=sys.stderr)
+    
+    def _flush_log(self) -> None:
+        """Write queued log records out before returning to the caller.
+        
+        A queued MaskingLogger otherwise only drains on the next file switch
+        or at exit, and process-pool workers exit without running atexit.
+        Loggers without a flush method write synchronously.
+        """
+        flush = getattr(self.logger, "flush", None)
+        if flush is not None:
+            flush()
+    
+    def _emit(
+        self,
+        input_path: Path,
+        output_path: Path | None,
+        result: MaskingResult,
+        verbose: bool,
+        writer: ThreadPoolExecutor | None = None
+    ) -> Future | None:
+        """Print detected entities (if verbose) and write the masked text.
+        
+        With a writer executor the output file is written asynchronously
+        and the pending Future is returned; otherwise it is written inline.
+        """
+        if verbose and result.entities:
+            # Built as one block and written with a single print
+            lines = [
+                f"\n[{input_path.name}] Detected PII Entities:",
+                *(
+                    f"{i}. {entity.entity_type}: '{entity.text}' (score: {entity.score:.2f})"
+                    for i, entity in enumerate(result.entities, 1)
+                ),
+                f"Total: {len(result.entities)} entities detected",
+            ]
+            print("\n".join(lines), file=sys.stderr)
+        
+        if output_path:
+            if writer is not None:
+                return writer.submit(self._write_output, Path(output_path), result.masked_text)
+            self._write_output(Path(output_path), result.masked_text)
+        else:
+            print("\n=== Masked Text ===", file=sys.stderr)
+            print(result.masked_text)
+        return None
+    
+    def _cache_path(self, text: str, language: str) -> Path:
+        """Cache file for (text, language, masker config, allow list, versions).
+        
+        The resolved allow list is hashed along with the config because
+        the config only names the dictionary file, whose contents can
+        change between runs. _cache_salt() adds the cache format and the
+        package/model versions, so upgrades do not serve stale results.
+        """
+        if self._config_hash is None:
+            config = json.dumps(
+                [self.masker.config, get_allow_list(self.masker.config), _cache_salt()],
+                sort_keys=True, default=str
+            )
+            self._config_hash = hashlib.sha256(config.encode("utf-8")).hexdigest()[:16]
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}_{language}_{self._config_hash}.json"
+    
+    def _load_cached(self, text: str, language: str) -> MaskingResult | None:
+        """Return the cached result for text, or None on a miss.
+        
+        Lookup only: callers log the entities of a hit once the file
+        handler for that document is set up. Unreadable cache files count
+        as misses.
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            data = json.loads(self._cache_path(text, language).read_text(encoding="utf-8"))
+            return MaskingResult.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _store_cached(self, text: str, language: str, result: MaskingResult) -> None:
+        """Write result to the cache; failures only cost the cache entry."""
+        if self.cache_dir is None:
+            return
+        path = self._cache_path(text, language)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps(result.to_dict(), ensure_ascii=False), encoding="utf-8"
+            )
+            # Atomic rename: concurrent workers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write cache entry {path.name}: {e}", file=sys.stderr)
+    
+    @staticmethod
+    def _write_output(output_path: Path, masked_text: str) -> None:
+        """Write masked text to a file."""
+        output_path.write_text(masked_text, encoding="utf-8")
+        print(f"Masked text saved to {output_path}", file=sys.stderr)
     
     def process_text(
         self,
@@ -162,7 +435,8 @@ class MaskingServiceFactory:
     def create(
         config: dict[str, Any] | None = None,
         use_preprocessor: bool = False,
-        use_ner: bool = False
+        use_ner: bool = False,
+        cache_dir: Path | None = None
     ) -> MaskingService:
         """Create a MaskingService with default production dependencies.
         
@@ -170,6 +444,7 @@ class MaskingServiceFactory:
             config: Configuration dict (default: load from config.yaml)
             use_preprocessor: If True, use structure-aware preprocessing
             use_ner: If True, enable NER with preprocessor
+            cache_dir: Directory for cached MaskingResults (None = no cache)
             
         Returns:
             Configured MaskingService
@@ -178,13 +453,17 @@ class MaskingServiceFactory:
         from masking_logging import MaskingLogger
         
         config = config or load_config()
+        # One logger for both: the service switches its file handler and the
+        # masker writes through it (Masker uses the shared AnonymizerEngine).
+        # Queued, so log files are written off the masking path.
+        logger = MaskingLogger(queued=True)
         
         return MaskingService(
             extractor=TextExtractor(),
             masker=Masker(
-                anonymizer=AnonymizerEngine(),
-                logger=MaskingLogger(),
+                logger=logger,
                 config=config
             ),
-            logger=MaskingLogger()
+            logger=logger,
+            cache_dir=cache_dir
         )
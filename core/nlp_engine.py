@@ -0,0 +1,106 @@
+"""spaCy NLP engine used by the analyzer factories.
+
+Presidio's SpacyNlpEngine always loads the full spaCy pipeline.
+This subclass lets each model entry name the components to disable,
+so pipes whose output Presidio never reads are not run.
+It also loads a model listed under several languages (e.g. the
+English fallback for "ja" in pattern-only setups) only once.
+
+NoOpNlpEngine is for analyzers that only run pattern recognizers and so
+need no spaCy model at all.
+"""
+
+from collections.abc import Iterable, Iterator
+
+from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine, SpacyNlpEngine
+
+
+class TrimmedSpacyNlpEngine(SpacyNlpEngine):
+    """SpacyNlpEngine honoring an optional per-model ``disable`` list.
+
+    Model entries use Presidio's usual format plus an optional key:
+        {"lang_code": "ja", "model_name": "ja_ginza", "disable": ["parser"]}
+    """
+
+    engine_name = "spacy"
+
+    def load(self) -> None:
+        """Load each spaCy model with its unused components disabled.
+
+        Loading itself (GPU selection, model download, validation) is left
+        to SpacyNlpEngine.load, run over one entry per distinct model so
+        languages mapped to the same model (and disable list) share a
+        single Language object instead of loading it twice. Components are
+        then disabled with spaCy's disable_pipe, which is what
+        spacy.load(disable=...) does after loading.
+        """
+        models = self.models
+        unique: dict[tuple, dict] = {}
+        for model in models:
+            key = (model.get("model_name"), tuple(model.get("disable", ())))
+            unique.setdefault(key, model)
+
+        self.models = list(unique.values())
+        try:
+            super().load()
+        finally:
+            self.models = models
+
+        loaded = {key: self.nlp[model["lang_code"]] for key, model in unique.items()}
+        for (_, disable), nlp in loaded.items():
+            for name in disable:
+                if name in nlp.pipe_names:
+                    nlp.disable_pipe(name)
+
+        self.nlp = {
+            model["lang_code"]: loaded[
+                (model["model_name"], tuple(model.get("disable", ())))
+            ]
+            for model in models
+        }
+
+
+class NoOpNlpEngine(NlpEngine):
+    """NLP engine that loads no model and returns empty NlpArtifacts.
+
+    Pattern recognizers do not need tokens, lemmas or entities, so an
+    analyzer running only those can skip loading spaCy entirely.
+    Context-word score enhancement has no lemmas to match and is a no-op.
+    """
+
+    def __init__(self, languages: Iterable[str] = ("en",)):
+        self.languages = list(languages)
+
+    def load(self) -> None:
+        """Nothing to load."""
+
+    def is_loaded(self) -> bool:
+        return True
+
+    def process_text(self, text: str, language: str) -> NlpArtifacts:
+        return NlpArtifacts(
+            entities=[],
+            tokens=[],
+            tokens_indices=[],
+            lemmas=[],
+            nlp_engine=self,
+            language=language,
+        )
+
+    def process_batch(
+        self, texts: Iterable[str], language: str, **kwargs
+    ) -> Iterator[tuple[str, NlpArtifacts]]:
+        for text in texts:
+            yield text, self.process_text(text, language)
+
+    def is_stopword(self, word: str, language: str) -> bool:
+        return False
+
+    def is_punct(self, word: str, language: str) -> bool:
+        return False
+
+    def get_supported_entities(self) -> list[str]:
+        return []
+
+    def get_supported_languages(self) -> list[str]:
+        return self.languages
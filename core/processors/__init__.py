@@ -1,23 +1,40 @@
-"""Text and result processing utilities."""
-
-from .hybrid_detection import hybrid_detection_analyze
-from .result import deduplicate_results, merge_results
-from .text import preprocess_text, TextPreprocessor
-from .structure_restorer import StructureRestorer, TextSegment
-from .candidate_extractor import CandidateExtractor, Candidate
-from .candidate_verifier import CandidateVerifier, VerificationResult
-
-__all__ = [
-    "deduplicate_results",
-    "hybrid_detection_analyze",
-    "merge_results",
-    "preprocess_text",
-    "TextPreprocessor",
-    "StructureRestorer",
-    "TextSegment",
-    "CandidateExtractor",
-    "Candidate",
-    "CandidateVerifier",
-    "VerificationResult",
-]
+"""Text and result processing utilities.
 
+Names are resolved lazily (PEP 562): importing one submodule such as
+core.processors.result does not pull in hybrid_detection (Presidio/spaCy)
+or the candidate pipeline until those names are actually used.
+"""
+
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "deduplicate_results": "result",
+    "hybrid_detection_analyze": "hybrid_detection",
+    "hybrid_detection_analyze_batch": "hybrid_detection",
+    "merge_results": "result",
+    "preprocess_text": "text",
+    "TextPreprocessor": "text",
+    "StructureRestorer": "structure_restorer",
+    "TextSegment": "structure_restorer",
+    "CandidateExtractor": "candidate_extractor",
+    "Candidate": "candidate_extractor",
+    "CandidateVerifier": "candidate_verifier",
+    "VerificationResult": "candidate_verifier",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,16 +4,23 @@ Extracts PII candidates using regex patterns and NER models.
 """
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from itertools import pairwise
 
-from core.processors.structure_restorer import TextSegment
 from config import load_config
+from core.cache_keys import freeze, thaw
+from core.processors.structure_restorer import TextSegment
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
-    """Represents a PII candidate detection."""
+    """Represents a PII candidate detection.
+    
+    Slotted: a document yields one of these per rule/NER hit, and slots
+    drop the per-instance __dict__.
+    """
     entity_type: str          # EMAIL_ADDRESS, PHONE_NUMBER_JP, JP_PERSON, etc.
     text: str                 # Detected text
     start: int                # Start position in original text
@@ -24,6 +31,62 @@ class Candidate:
     section_type: str         # Section type (contact, education, etc.)
 
 
+@lru_cache(maxsize=1)
+def _load_ginza():
+    """Load GiNZA (a spaCy Language) for candidate NER once per process, or None.
+    
+    Only doc.ents is read, so the dependency parser (and the bunsetu
+    recognizer built on it) is not loaded; the same components
+    core.analyzer disables for its GiNZA engine.
+    """
+    from core.analyzer import disabled_components
+    try:
+        import spacy
+        return spacy.load("ja_ginza", disable=list(disabled_components("ja_ginza")))
+    except ImportError:
+        import warnings
+        warnings.warn("spacy/ginza not available - GiNZA NER disabled")
+    except OSError:
+        import warnings
+        warnings.warn("ja_ginza model not found - GiNZA NER disabled")
+    return None
+
+
+@lru_cache(maxsize=4)
+def _load_transformer_recognizers(frozen_config: frozenset | None) -> tuple:
+    """Build the Transformer recognizers once per config.
+    
+    Returns:
+        Tuple of {"id", "recognizer", "language"} dicts
+    """
+    recognizers = []
+    try:
+        from model_registry import ModelRegistry
+        registry = ModelRegistry(thaw(frozen_config))
+        models = registry.list_models()
+        
+        for model_id in models:
+            try:
+                recognizer = registry.get_recognizer(model_id)
+                if recognizer:
+                    recognizers.append({
+                        "id": model_id,
+                        "recognizer": recognizer,
+                        "language": models[model_id].get("language", "ja")
+                    })
+            except Exception as e:
+                import warnings
+                warnings.warn(f"Failed to load transformer model {model_id}: {e}")
+    except ImportError:
+        import warnings
+        warnings.warn("ModelRegistry not available - Transformer NER disabled")
+    except Exception as e:
+        import warnings
+        warnings.warn(f"Failed to initialize Transformer NER: {e}")
+    
+    return tuple(recognizers)
+
+
 class CandidateExtractor:
     """Extracts PII candidates using regex patterns and NER."""
     
@@ -62,6 +125,12 @@ class CandidateExtractor:
         re.compile(r'\b\d{4}/\d{1,2}/\d{1,2}\b'),
     ]
     
+    # Distinct (line, section type) pairs remembered by _extract_from_segment
+    SEGMENT_CACHE_SIZE = 4096
+    
+    # Keywords marking a date as a birth date (matched on lowercased text)
+    BIRTH_KEYWORDS = ('birth', '生年月日', '誕生', '生まれ', 'date of birth')
+    
     # Age pattern (Japanese)
     AGE_PATTERN = re.compile(r'(\d{1,3})\s*歳')
     
@@ -70,6 +139,10 @@ class CandidateExtractor:
         re.compile(r'[（(]?\s*(男性?|女性?|男|女)\s*[）)]?'),
     ]
     
+    # Phone, postal code, date and age rules all need a digit; a segment
+    # without one skips those scans entirely
+    DIGIT_PROBE = re.compile(r'\d')
+    
     # Japanese address prefecture patterns
     JP_ADDRESS_PREFIXES = [
         '北海道', '青森県', '岩手県', '宮城県', '秋田県', '山形県', '福島県',
@@ -81,7 +154,19 @@ class CandidateExtractor:
         '熊本県', '大分県', '宮崎県', '鹿児島県', '沖縄県'
     ]
     
-    def __init__(self, config: Optional[Dict] = None, use_ner: bool = False):
+    # All prefectures in one pattern. The lookahead makes each match
+    # zero-width, so overlapping names (e.g. 東京都 / 京都府 in 東京都府中市)
+    # are all reported, as with one substring search per prefecture.
+    JP_ADDRESS_PATTERN = re.compile(
+        '(?=(' + '|'.join(map(re.escape, sorted(JP_ADDRESS_PREFIXES, key=len, reverse=True))) + '))'
+    )
+    
+    # Where an address ends: line break, full-width or double space, or the
+    # next contact label. One search finds the nearest of them. Case variants
+    # are spelled out: "EMAIL" or "Tel" do not end an address.
+    JP_ADDRESS_DELIMITER_PATTERN = re.compile(r'\n|　|  |[Ee]mail|[Pp]hone|TEL|tel')
+    
+    def __init__(self, config: dict | None = None, use_ner: bool = False):
         """Initialize candidate extractor.
         
         Args:
@@ -99,6 +184,10 @@ class CandidateExtractor:
         self._nlp_ja = None
         self._transformer_recognizers = None
         self._ner_initialized = False
+        
+        # Rule hits per (line_text, section_type), relative to the segment
+        # start. Repeated lines (page headers, footers) are scanned once.
+        self._segment_cache: dict[tuple[str, str], list[tuple[str, str, int, int, float, str]]] = {}
 
     
     def _load_extraction_config(self) -> None:
@@ -111,6 +200,12 @@ class CandidateExtractor:
             "JP_ADDRESS",
             "JP_PERSON"
         ])
+        # Type -> rank (first occurrence wins, as with list.index); unknown
+        # types rank after every listed one
+        self._priority_map = {}
+        for rank, entity_type in enumerate(self.entity_priority):
+            self._priority_map.setdefault(entity_type, rank)
+        self._priority_default = len(self.entity_priority)
     
     def _init_ner_engines(self) -> None:
         """Initialize NER engines (GiNZA and Transformer).
@@ -120,52 +215,18 @@ class CandidateExtractor:
         if self._ner_initialized:
             return
         
-        # Initialize GiNZA
-        try:
-            import spacy
-            self._nlp_ja = spacy.load("ja_ginza")
-        except ImportError:
-            import warnings
-            warnings.warn("spacy/ginza not available - GiNZA NER disabled")
-            self._nlp_ja = None
-        except OSError:
-            import warnings
-            warnings.warn("ja_ginza model not found - GiNZA NER disabled")
-            self._nlp_ja = None
-        
-        # Initialize Transformer recognizers from config
-        self._transformer_recognizers = []
-        try:
-            from model_registry import ModelRegistry
-            registry = ModelRegistry(self.config)
-            models = registry.list_models()
-            
-            for model_id in models:
-                try:
-                    recognizer = registry.get_recognizer(model_id)
-                    if recognizer:
-                        self._transformer_recognizers.append({
-                            "id": model_id,
-                            "recognizer": recognizer,
-                            "language": models[model_id].get("language", "ja")
-                        })
-                except Exception as e:
-                    import warnings
-                    warnings.warn(f"Failed to load transformer model {model_id}: {e}")
-        except ImportError:
-            import warnings
-            warnings.warn("ModelRegistry not available - Transformer NER disabled")
-        except Exception as e:
-            import warnings
-            warnings.warn(f"Failed to initialize Transformer NER: {e}")
+        # Models are loaded once per process and shared by every extractor
+        # (see _load_ginza / _load_transformer_recognizers)
+        self._nlp_ja = _load_ginza()
+        self._transformer_recognizers = list(_load_transformer_recognizers(freeze(self.config)))
         
         self._ner_initialized = True
     
     def _extract_ner_candidates(
         self,
         text: str,
-        segments: List[TextSegment]
-    ) -> List[Candidate]:
+        segments: list[TextSegment]
+    ) -> list[Candidate]:
         """Extract PII candidates using NER engines.
         
         Args:
@@ -177,11 +238,21 @@ class CandidateExtractor:
         """
         candidates = []
         
-        # Build segment lookup for position-to-section mapping
-        def get_section_for_position(pos: int) -> Tuple[str, str]:
-            for segment in segments:
-                if segment.char_start <= pos < segment.char_end:
+        # Build segment lookup for position-to-section mapping. Segments are
+        # disjoint lines, so the one containing pos is found by bisecting on
+        # their starts (skipping back over empty segments at the same start).
+        ordered = sorted(segments, key=lambda s: s.char_start)
+        starts = [segment.char_start for segment in ordered]
+        
+        def get_section_for_position(pos: int) -> tuple[str, str]:
+            i = bisect_right(starts, pos)
+            while i:
+                i -= 1
+                segment = ordered[i]
+                if pos < segment.char_end:
                     return segment.section_id, segment.section_type
+                if segment.char_start < segment.char_end:
+                    break
             return "unknown", "unknown"
         
         # GiNZA NER
@@ -242,7 +313,7 @@ class CandidateExtractor:
         return candidates
 
     
-    def extract(self, segments: List[TextSegment]) -> List[Candidate]:
+    def extract(self, segments: list[TextSegment]) -> list[Candidate]:
         """Extract PII candidates from structured segments.
         
         Args:
@@ -253,16 +324,16 @@ class CandidateExtractor:
         """
         candidates = []
         
-        # Reconstruct full text for position tracking
-        full_text = self._reconstruct_text(segments)
-        
-        # Regex-based extraction from each segment
+        # Regex-based extraction from each segment (positions come from
+        # segment.char_start, so no full text is needed here)
         for segment in segments:
-            segment_candidates = self._extract_from_segment(segment, full_text)
+            segment_candidates = self._extract_from_segment(segment)
             candidates.extend(segment_candidates)
         
-        # NER-based extraction (if enabled)
+        # NER-based extraction (if enabled). Only NER runs over the full
+        # text, so it is reconstructed only in this case.
         if self.use_ner:
+            full_text = self._reconstruct_text(segments)
             self._init_ner_engines()
             ner_candidates = self._extract_ner_candidates(full_text, segments)
             candidates.extend(ner_candidates)
@@ -275,22 +346,24 @@ class CandidateExtractor:
         
         return candidates
     
-    def _reconstruct_text(self, segments: List[TextSegment]) -> str:
+    def _reconstruct_text(self, segments: list[TextSegment]) -> str:
         """Reconstruct full text from segments."""
         if not segments:
             return ""
         
-        # Find the maximum end position to determine text length
-        max_end = max(s.char_end for s in segments)
+        # Segments normally arrive in order; only sort when they do not
+        if any(a.char_start > b.char_start for a, b in pairwise(segments)):
+            segments = sorted(segments, key=lambda s: s.char_start)
         
-        # Create a text buffer
+        # Collect parts and join once; gaps only add padding when present
         text_parts = []
         last_end = 0
         
-        for segment in sorted(segments, key=lambda s: s.char_start):
+        for segment in segments:
             # Add spacing if there's a gap
-            if segment.char_start > last_end:
-                text_parts.append(' ' * (segment.char_start - last_end))
+            gap = segment.char_start - last_end
+            if gap > 0:
+                text_parts.append(' ' * gap)
             text_parts.append(segment.line_text)
             last_end = segment.char_end
         
@@ -299,38 +372,74 @@ class CandidateExtractor:
     def _extract_from_segment(
         self, 
         segment: TextSegment,
-        full_text: str
-    ) -> List[Candidate]:
+        full_text: str | None = None
+    ) -> list[Candidate]:
         """Extract candidates from a single segment.
         
         Args:
             segment: TextSegment to process
-            full_text: Full reconstructed text
+            full_text: Unused; the rules only look at segment.line_text.
+                Kept so existing callers passing it keep working.
             
         Returns:
             List of detected candidates
         """
-        candidates = []
         text = segment.line_text
         offset = segment.char_start
         
-        # Extract email
-        candidates.extend(self._extract_emails(text, offset, segment))
-        
-        # Extract phone numbers
-        candidates.extend(self._extract_phones(text, offset, segment))
+        # Rule hits only depend on the line and its section type; rebuild
+        # candidates for this segment's position and section from the cache
+        key = (text, segment.section_type)
+        hits = self._segment_cache.get(key)
+        if hits is not None:
+            return [
+                Candidate(entity_type, hit_text, offset + start, offset + end, score,
+                          source, segment.section_id, segment.section_type)
+                for entity_type, hit_text, start, end, score, source in hits
+            ]
+        
+        candidates = self._scan_segment(text, offset, segment)
+        if len(self._segment_cache) >= self.SEGMENT_CACHE_SIZE:
+            self._segment_cache.clear()
+        self._segment_cache[key] = [
+            (c.entity_type, c.text, c.start - offset, c.end - offset, c.score, c.source)
+            for c in candidates
+        ]
+        return candidates
+    
+    def _scan_segment(
+        self,
+        text: str,
+        offset: int,
+        segment: TextSegment
+    ) -> list[Candidate]:
+        """Run every rule over one segment's text."""
+        candidates = []
         
-        # Extract postal codes
-        candidates.extend(self._extract_postal_codes(text, offset, segment))
+        # Each rule family only runs when the segment contains a character
+        # its patterns require, so lines without '@', digits or 男/女 are
+        # not scanned by those patterns at all.
         
-        # Extract dates (potential birth dates)
-        candidates.extend(self._extract_dates(text, offset, segment))
+        # Extract email
+        if '@' in text:
+            candidates.extend(self._extract_emails(text, offset, segment))
         
-        # Extract age
-        candidates.extend(self._extract_age(text, offset, segment))
+        if self.DIGIT_PROBE.search(text):
+            # Extract phone numbers
+            candidates.extend(self._extract_phones(text, offset, segment))
+            
+            # Extract postal codes
+            candidates.extend(self._extract_postal_codes(text, offset, segment))
+            
+            # Extract dates (potential birth dates)
+            candidates.extend(self._extract_dates(text, offset, segment))
+            
+            # Extract age
+            candidates.extend(self._extract_age(text, offset, segment))
         
         # Extract gender
-        candidates.extend(self._extract_gender(text, offset, segment))
+        if '男' in text or '女' in text:
+            candidates.extend(self._extract_gender(text, offset, segment))
         
         # Extract Japanese addresses
         candidates.extend(self._extract_jp_addresses(text, offset, segment))
@@ -342,7 +451,7 @@ class CandidateExtractor:
         text: str, 
         offset: int, 
         segment: TextSegment
-    ) -> List[Candidate]:
+    ) -> list[Candidate]:
         """Extract email addresses."""
         candidates = []
         
@@ -365,7 +474,7 @@ class CandidateExtractor:
         text: str, 
         offset: int, 
         segment: TextSegment
-    ) -> List[Candidate]:
+    ) -> list[Candidate]:
         """Extract phone numbers."""
         candidates = []
         
@@ -404,29 +513,29 @@ class CandidateExtractor:
         text: str, 
         offset: int, 
         segment: TextSegment
-    ) -> List[Candidate]:
+    ) -> list[Candidate]:
         """Extract postal codes."""
         candidates = []
         
         # Japanese postal code
         for match in self.JP_ZIP_PATTERN.finditer(text):
-            matched_text = match.group()
+            start = match.start()
             
-            # Skip year ranges like "2016-2024" that could match as "016-2024"
-            # Check if preceded by a digit (indicating year range)
-            if match.start() > 0 and text[match.start() - 1].isdigit():
+            # Skip year ranges like "2016-2024" that could match as "016-2024":
+            # reject matches preceded by a digit or by "<digit>-". This stays a
+            # post-filter rather than a lookbehind, since a rejected match
+            # must still consume its text (a lookbehind would let the scan
+            # retry inside it and accept e.g. "123-4567" in "5 123-4567").
+            if start and (
+                text[start - 1].isdigit()
+                or (start >= 2 and text[start - 1] == '-' and text[start - 2].isdigit())
+            ):
                 continue
             
-            # Check for year range context (YYYY-YYYY pattern)
-            if match.start() >= 2:
-                before = text[match.start() - 2:match.start()]
-                if before.isdigit() or (before[0].isdigit() and before[1] == '-'):
-                    continue
-            
             candidates.append(Candidate(
                 entity_type="JP_ZIP_CODE",
-                text=matched_text,
-                start=offset + match.start(),
+                text=match.group(),
+                start=offset + start,
                 end=offset + match.end(),
                 score=0.95,
                 source="rule:jp_zip_regex",
@@ -437,9 +546,9 @@ class CandidateExtractor:
         # US postal code (only in contact section to reduce false positives)
         if segment.section_type in ["contact", "header"]:
             for match in self.US_ZIP_PATTERN.finditer(text):
-                # Skip if looks like a year (1900-2100)
-                val = match.group()[:4] if len(match.group()) >= 4 else match.group()
-                if val.isdigit() and 1900 <= int(val) <= 2100:
+                # Skip if looks like a year (1900-2100). The pattern always
+                # matches at least five digits, so the first four are digits.
+                if 1900 <= int(match.group()[:4]) <= 2100:
                     continue
                     
                 candidates.append(Candidate(
@@ -460,17 +569,19 @@ class CandidateExtractor:
         text: str, 
         offset: int, 
         segment: TextSegment
-    ) -> List[Candidate]:
+    ) -> list[Candidate]:
         """Extract dates (potential birth dates)."""
         candidates = []
+        # Birth-date context is a property of the whole segment: checked
+        # once, on the first date found
+        is_birth_context = None
         
         for pattern in self.DATE_PATTERNS:
             for match in pattern.finditer(text):
                 # Determine if likely birth date based on context
-                is_birth_context = any(
-                    kw in text.lower() 
-                    for kw in ['birth', '生年月日', '誕生', '生まれ', 'date of birth']
-                )
+                if is_birth_context is None:
+                    text_lower = text.lower()
+                    is_birth_context = any(kw in text_lower for kw in self.BIRTH_KEYWORDS)
                 
                 score = 0.9 if is_birth_context else 0.5
                 entity_type = "DATE_OF_BIRTH_JP" if is_birth_context else "DATE"
@@ -493,7 +604,7 @@ class CandidateExtractor:
         text: str, 
         offset: int, 
         segment: TextSegment
-    ) -> List[Candidate]:
+    ) -> list[Candidate]:
         """Extract age mentions."""
         candidates = []
         
@@ -519,7 +630,7 @@ class CandidateExtractor:
         text: str, 
         offset: int, 
         segment: TextSegment
-    ) -> List[Candidate]:
+    ) -> list[Candidate]:
         """Extract gender mentions."""
         candidates = []
         
@@ -543,22 +654,23 @@ class CandidateExtractor:
         text: str, 
         offset: int, 
         segment: TextSegment
-    ) -> List[Candidate]:
+    ) -> list[Candidate]:
         """Extract Japanese addresses starting with prefecture."""
         candidates = []
         
+        # One scan for every prefecture; keep the first occurrence of each
+        first_seen: dict[str, int] = {}
+        for match in self.JP_ADDRESS_PATTERN.finditer(text):
+            first_seen.setdefault(match.group(1), match.start())
+        if not first_seen:
+            return candidates
+        
         for prefecture in self.JP_ADDRESS_PREFIXES:
-            if prefecture in text:
-                # Find the prefecture and extract following address
-                start_idx = text.index(prefecture)
-                
+            start_idx = first_seen.get(prefecture)
+            if start_idx is not None:
                 # Extract until end of line or common delimiter
-                end_idx = len(text)
-                for delimiter in ['\n', '　', '  ', 'Email', 'email', 'Phone', 'phone', 'TEL', 'tel']:
-                    if delimiter in text[start_idx:]:
-                        potential_end = start_idx + text[start_idx:].index(delimiter)
-                        if potential_end < end_idx:
-                            end_idx = potential_end
+                delimiter = self.JP_ADDRESS_DELIMITER_PATTERN.search(text, start_idx)
+                end_idx = delimiter.start() if delimiter else len(text)
                 
                 address_text = text[start_idx:end_idx].strip()
                 
@@ -577,7 +689,7 @@ class CandidateExtractor:
         
         return candidates
     
-    def _merge_candidates(self, candidates: List[Candidate]) -> List[Candidate]:
+    def _merge_candidates(self, candidates: list[Candidate]) -> list[Candidate]:
         """Merge overlapping candidates, keeping higher priority/score.
         
         Args:
@@ -590,34 +702,41 @@ class CandidateExtractor:
             return []
         
         # Sort by start position, then by priority (lower index = higher priority)
+        rank = self._priority_map.get
+        default = self._priority_default
+        
         def priority_key(c: Candidate) -> int:
-            try:
-                return self.entity_priority.index(c.entity_type)
-            except ValueError:
-                return len(self.entity_priority)  # Unknown types at end
+            return rank(c.entity_type, default)  # Unknown types at end
         
         sorted_candidates = sorted(
             candidates, 
             key=lambda c: (c.start, priority_key(c), -c.score)
         )
         
+        # Kept candidates never overlap each other and arrive in start order,
+        # so a new candidate can only overlap the kept non-empty candidate
+        # with the greatest end (``last``). One comparison per candidate
+        # replaces the scan over everything kept so far.
         merged = []
+        last = None
         for candidate in sorted_candidates:
-            # Check if overlaps with any existing
-            overlaps = False
-            for existing in merged:
-                if self._overlaps(candidate, existing):
-                    overlaps = True
-                    # Keep higher priority or higher score
-                    if (priority_key(candidate) < priority_key(existing) or 
-                        (priority_key(candidate) == priority_key(existing) and 
-                         candidate.score > existing.score)):
-                        merged.remove(existing)
+            if last is not None and self._overlaps(candidate, last):
+                # Keep higher priority or higher score
+                if (priority_key(candidate) < priority_key(last) or 
+                    (priority_key(candidate) == priority_key(last) and 
+                     candidate.score > last.score)):
+                    if merged[-1] is last:
+                        merged[-1] = candidate
+                    else:
+                        merged.remove(last)
                         merged.append(candidate)
-                    break
+                    # An empty span cannot overlap anything that follows
+                    last = candidate if candidate.start < candidate.end else None
+                continue
             
-            if not overlaps:
-                merged.append(candidate)
+            merged.append(candidate)
+            if candidate.start < candidate.end:
+                last = candidate
         
         return merged
     
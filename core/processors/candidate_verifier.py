@@ -5,12 +5,12 @@ and allow-lists.
 """
 
 import re
-from dataclasses import dataclass, replace
-from typing import List, Dict, Optional, Set
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Optional, Set
 
-from core.processors.candidate_extractor import Candidate
 from config import load_config
+from core.processors.candidate_extractor import Candidate
 
 
 @dataclass
@@ -100,6 +100,10 @@ class CandidateVerifier:
             "entity_priority", 
             self.DEFAULT_PRIORITY
         )
+        # Type -> rank (first occurrence wins, as with list.index)
+        self._priority_map = {}
+        for rank, entity_type in enumerate(self.entity_priority):
+            self._priority_map.setdefault(entity_type, rank)
     
     def _load_allow_list(self) -> None:
         """Load allow list from config and dictionary file."""
@@ -427,10 +431,7 @@ class CandidateVerifier:
     
     def _get_priority(self, candidate: Candidate) -> int:
         """Get priority index for candidate (lower = higher priority)."""
-        try:
-            return self.entity_priority.index(candidate.entity_type)
-        except ValueError:
-            return len(self.entity_priority)
+        return self._priority_map.get(candidate.entity_type, len(self.entity_priority))
     
     def get_maskable_candidates(
         self, 
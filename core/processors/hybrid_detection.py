@@ -6,9 +6,67 @@ This module implements the hybrid detection strategy:
 """
 
 import warnings
+from functools import lru_cache
 from typing import Any
 
-from presidio_analyzer import RecognizerResult
+from presidio_analyzer import AnalyzerEngine, RecognizerResult
+
+from core.analyzer import (
+    EN_MODEL,
+    JA_MODEL_GINZA,
+    analyze_batch,
+    get_nlp_engine_or_none,
+    get_registry,
+)
+from core.cache_keys import freeze, thaw
+
+
+@lru_cache(maxsize=1)
+def _get_pattern_analyzer() -> AnalyzerEngine:
+    """
+    Build the en+ja analyzer for pattern_entities once per process.
+    
+    Shares the spaCy/GiNZA engine and recognizer registry with core.analyzer,
+    so repeated hybrid calls do not rebuild recognizers or AnalyzerEngine.
+    The shared engine maps GiNZA labels to project entities and skips the
+    dependency parser, like the analyzers built by core.analyzer.
+    """
+    # Setup NLP engine for GiNZA/spaCy (shared with core.analyzer)
+    nlp_engine = get_nlp_engine_or_none((("en", EN_MODEL), ("ja", JA_MODEL_GINZA)))
+
+    if nlp_engine:
+        pattern_analyzer = AnalyzerEngine(
+            nlp_engine=nlp_engine,
+            supported_languages=["en", "ja"]
+        )
+    else:
+        pattern_analyzer = AnalyzerEngine(supported_languages=["en", "ja"])
+
+    get_registry(True, False, None).apply_to_analyzer(pattern_analyzer)
+    return pattern_analyzer
+
+
+@lru_cache(maxsize=4)
+def _get_ml_recognizers(frozen_app_config: frozenset | None) -> tuple:
+    """
+    Build the Transformer / GPT recognizers once per app config.
+    
+    Loading the ML models dominates a hybrid call, so they are kept
+    for the life of the process rather than rebuilt per text.
+    """
+    from recognizers.registry import create_default_registry
+
+    transformer_registry = create_default_registry(
+        use_ginza=False,
+        use_transformer=True,
+        app_config=thaw(frozen_app_config)
+    )
+    
+    # Get ML recognizers directly (avoid AnalyzerEngine default recognizers)
+    return tuple(
+        config.recognizer for config in transformer_registry.configs
+        if config.type in {"ner_transformer", "ner_gpt_masker"}
+    )
 
 
 def hybrid_detection_analyze(
@@ -17,7 +75,9 @@ def hybrid_detection_analyze(
     pattern_entities: list[str],
     language: str = "ja",
     app_config: dict[str, Any] | None = None,
-    allow_list: list[str] | None = None
+    allow_list: list[str] | None = None,
+    *,
+    frozen_app_config: frozenset | None = None
 ) -> list[RecognizerResult]:
     """
     Hybrid detection: Route entities to appropriate recognizers.
@@ -25,6 +85,9 @@ def hybrid_detection_analyze(
     - transformer_entities → Transformer NER (high-precision ML models)
     - pattern_entities → Pattern/GiNZA recognizers (rule-based)
     
+    The analyzer and ML recognizers are built on the first call and
+    reused afterwards (see _get_pattern_analyzer / _get_ml_recognizers).
+    
     Args:
         text: Text to analyze
         transformer_entities: Entity types for Transformer NER
@@ -32,47 +95,18 @@ def hybrid_detection_analyze(
         language: Language code ("en", "ja", or "auto")
         app_config: Full application config (for ModelRegistry)
         allow_list: List of terms to exclude from PII detection
+        frozen_app_config: app_config already passed through
+            core.cache_keys.freeze; takes precedence over app_config, so
+            callers reusing one config do not re-freeze it on every call
         
     Returns:
         List of RecognizerResult objects from both sources
     """
-    from presidio_analyzer import AnalyzerEngine
-    from presidio_analyzer.nlp_engine import NlpEngineProvider
-
-    from recognizers.registry import create_default_registry
-
     all_results = []
 
-    # Setup NLP engine for GiNZA/spaCy
-    try:
-        nlp_configuration = {
-            "nlp_engine_name": "spacy",
-            "models": [
-                {"lang_code": "en", "model_name": "en_core_web_lg"},
-                {"lang_code": "ja", "model_name": "ja_ginza"},
-            ],
-        }
-        nlp_engine = NlpEngineProvider(nlp_configuration=nlp_configuration).create_engine()
-    except Exception as e:
-        warnings.warn(f"Failed to create NLP engine: {e}")
-        nlp_engine = None
-
     # === Pattern Recognizers for pattern_entities ===
     if pattern_entities:
-        pattern_registry = create_default_registry(
-            use_ginza=True,
-            use_transformer=False
-        )
-        
-        if nlp_engine:
-            pattern_analyzer = AnalyzerEngine(
-                nlp_engine=nlp_engine,
-                supported_languages=["en", "ja"]
-            )
-        else:
-            pattern_analyzer = AnalyzerEngine(supported_languages=["en", "ja"])
-        
-        pattern_registry.apply_to_analyzer(pattern_analyzer)
+        pattern_analyzer = _get_pattern_analyzer()
         
         # Analyze with pattern recognizers
         if language == "auto":
@@ -95,19 +129,9 @@ def hybrid_detection_analyze(
 
     # === Transformer NER for transformer_entities ===
     if transformer_entities:
-        transformer_registry = create_default_registry(
-            use_ginza=False,
-            use_transformer=True,
-            app_config=app_config
-        )
-        
-        # Get ML recognizers directly (avoid AnalyzerEngine default recognizers)
-        ml_recognizers = [
-            config.recognizer for config in transformer_registry.configs
-            if config.type in {"ner_transformer", "ner_gpt_masker"}
-        ]
-        
-        for recognizer in ml_recognizers:
+        if frozen_app_config is None:
+            frozen_app_config = freeze(app_config)
+        for recognizer in _get_ml_recognizers(frozen_app_config):
             # Match language
             if language == "auto" or recognizer.supported_language == language:
                 try:
@@ -117,6 +141,78 @@ def hybrid_detection_analyze(
                     )
                     all_results.extend(results)
                 except Exception as e:
-                    warnings.warn(f"ML analysis failed: {e}")
+                    warnings.warn(f"ML analysis failed: {e}", stacklevel=2)
+
+    return all_results
+
+
+def hybrid_detection_analyze_batch(
+    texts: list[str],
+    transformer_entities: list[str],
+    pattern_entities: list[str],
+    language: str = "ja",
+    app_config: dict[str, Any] | None = None,
+    allow_list: list[str] | None = None,
+    *,
+    frozen_app_config: frozenset | None = None
+) -> list[list[RecognizerResult]]:
+    """
+    Batched hybrid_detection_analyze over several texts.
+    
+    Pattern/GiNZA analysis tokenizes all texts with one nlp.pipe() pass per
+    language, and ML recognizers that provide analyze_batch (Transformer NER)
+    run one padded forward pass per batch instead of one per text. Other
+    ML recognizers (GPT masker) still run text by text.
+    
+    Args:
+        texts: Texts to analyze
+        transformer_entities: Entity types for Transformer NER
+        pattern_entities: Entity types for Pattern recognizers
+        language: Language code ("en", "ja", or "auto")
+        app_config: Full application config (for ModelRegistry)
+        allow_list: List of terms to exclude from PII detection
+        frozen_app_config: app_config already passed through
+            core.cache_keys.freeze; takes precedence over app_config, so
+            callers reusing one config do not re-freeze it on every call
+        
+    Returns:
+        One RecognizerResult list per text, in input order
+    """
+    all_results: list[list[RecognizerResult]] = [[] for _ in texts]
+
+    # === Pattern Recognizers for pattern_entities ===
+    if pattern_entities:
+        pattern_analyzer = _get_pattern_analyzer()
+        languages = ["en", "ja"] if language == "auto" else [language]
+        for lang in languages:
+            batch = analyze_batch(
+                pattern_analyzer, texts, lang,
+                entities=pattern_entities, allow_list=allow_list
+            )
+            for text_results, results in zip(all_results, batch, strict=True):
+                text_results.extend(results)
+
+    # === Transformer NER for transformer_entities ===
+    if transformer_entities:
+        if frozen_app_config is None:
+            frozen_app_config = freeze(app_config)
+        for recognizer in _get_ml_recognizers(frozen_app_config):
+            if not (language == "auto" or recognizer.supported_language == language):
+                continue
+            batch_analyze = getattr(recognizer, "analyze_batch", None)
+            if batch_analyze is not None:
+                try:
+                    batch = batch_analyze(texts, transformer_entities)
+                except Exception as e:
+                    warnings.warn(f"ML analysis failed: {e}", stacklevel=2)
+                    continue
+                for text_results, results in zip(all_results, batch, strict=True):
+                    text_results.extend(results)
+                continue
+            for text, text_results in zip(texts, all_results, strict=True):
+                try:
+                    text_results.extend(recognizer.analyze(text=text, entities=transformer_entities))
+                except Exception as e:
+                    warnings.warn(f"ML analysis failed: {e}", stacklevel=2)
 
     return all_results
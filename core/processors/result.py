@@ -3,6 +3,7 @@
 Handles deduplication and merging of RecognizerResult objects.
 """
 
+from bisect import bisect_left
 
 
 def deduplicate_results(results, text: str):
@@ -23,20 +24,30 @@ def deduplicate_results(results, text: str):
     # Sort by score (descending), then by start position
     sorted_results = sorted(results, key=lambda x: (-x.score, x.start))
 
-    # Keep track of which positions have been covered
-    covered_positions = set()
+    # Kept spans are disjoint, so they are tracked as intervals sorted by
+    # start (ends are then sorted too) instead of a set of every covered
+    # character position. A new span [start, end) overlaps a kept one iff
+    # the last kept interval starting before `end` ends after `start`.
+    kept_starts: list[int] = []
+    kept_ends: list[int] = []
     deduplicated = []
 
     for result in sorted_results:
-        # Check if this result overlaps with already covered positions
-        result_positions = set(range(result.start, result.end))
-        if result_positions & covered_positions:
+        start, end = result.start, result.end
+        if start >= end:
+            # Empty span covers no positions and never overlaps
+            deduplicated.append(result)
+            continue
+
+        i = bisect_left(kept_starts, end)
+        if i and kept_ends[i - 1] > start:
             # This result overlaps with a higher-scoring result, skip it
             continue
 
-        # Add this result and mark its positions as covered
+        # Add this result and mark its span as covered
         deduplicated.append(result)
-        covered_positions.update(result_positions)
+        kept_starts.insert(i, start)
+        kept_ends.insert(i, end)
 
     # Sort back by position for consistent ordering
     deduplicated.sort(key=lambda x: x.start)
@@ -57,7 +68,7 @@ def merge_results(results_en, results_ja):
     Returns:
         Combined list of RecognizerResult objects
     """
-    all_results = list(results_en) + list(results_ja)
+    all_results = [*results_en, *results_ja]
 
     if not all_results:
         return all_results
@@ -65,20 +76,22 @@ def merge_results(results_en, results_ja):
     # Sort by score descending, then by span length (prefer longer matches)
     sorted_results = sorted(all_results, key=lambda x: (-x.score, -(x.end - x.start), x.start))
 
-    # Remove overlapping results, keeping higher-scoring ones
-    covered_positions = set()
+    # Remove overlapping results, keeping higher-scoring ones. Covered
+    # positions are one byte per character, so each overlap check is a
+    # C-level count over a contiguous slice instead of set arithmetic.
+    covered = bytearray(max(0, *(r.end for r in all_results)))
     merged = []
 
     for result in sorted_results:
-        result_positions = set(range(result.start, result.end))
+        # Clamp so an empty/reversed span never becomes a negative-index slice
+        start, end = result.start, max(result.start, result.end)
         # Check for significant overlap (more than 50% of the smaller span)
-        overlap = result_positions & covered_positions
-        if len(overlap) > len(result_positions) * 0.5:
+        if covered.count(1, start, end) > (end - start) * 0.5:
             # Significant overlap with a higher-scoring result, skip
             continue
 
         merged.append(result)
-        covered_positions.update(result_positions)
+        covered[start:end] = b"\x01" * (end - start)
 
     # Sort by position for consistent ordering
     merged.sort(key=lambda x: x.start)
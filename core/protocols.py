@@ -6,6 +6,7 @@ Defines interfaces for external dependencies to enable:
 - Clear layer boundaries
 """
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
@@ -40,14 +41,14 @@ class AnonymizerProtocol(Protocol):
         *,
         text: str,
         analyzer_results: list,
-        operators: dict
+        operators: Mapping[str, Any]
     ) -> Any:
         """Anonymize text based on analyzer results.
         
         Args:
             text: Text to anonymize
             analyzer_results: List of RecognizerResult
-            operators: Dict of entity_type -> OperatorConfig
+            operators: Mapping of entity_type -> OperatorConfig (read-only)
             
         Returns:
             AnonymizerResult with .text attribute
@@ -86,6 +87,8 @@ class NullLogger:
     Useful for tests where logging is not needed.
     """
     
+    enabled = False
+    
     def log(self, message: str) -> None:
         """Do nothing."""
         pass
@@ -93,3 +96,7 @@ class NullLogger:
     def setup_file_handler(self, path: Path) -> None:
         """Do nothing."""
         pass
+    
+    def flush(self) -> None:
+        """Do nothing."""
+        pass
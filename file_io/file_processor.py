@@ -7,9 +7,11 @@ Layer: Adapter (between CLI and Application layer)
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
-from core.masking_service import MaskingServiceFactory
+from core.masking_service import MaskingService, MaskingServiceFactory
 
 
 def process_file(
@@ -19,7 +21,9 @@ def process_file(
     language: str,
     verbose: bool,
     use_preprocessor: bool = False,
-    use_ner: bool = False
+    use_ner: bool = False,
+    service: MaskingService | None = None,
+    cache_dir: Path | None = None
 ) -> None:
     """
     Process a single file: extract, mask, log, and save.
@@ -34,13 +38,19 @@ def process_file(
         verbose: If True, print detected entities
         use_preprocessor: If True, use structure-aware TextPreprocessor pipeline
         use_ner: If True (with use_preprocessor), enable NER engines
+        service: Prebuilt MaskingService to reuse across files. If omitted,
+            one is created for this call from use_preprocessor/use_ner.
+        cache_dir: Directory for cached masking results (None = no cache).
+            Ignored when service is given.
     """
     try:
-        # Create service with appropriate configuration
-        service = MaskingServiceFactory.create(
-            use_preprocessor=use_preprocessor,
-            use_ner=use_ner
-        )
+        # Create service with appropriate configuration unless injected
+        if service is None:
+            service = MaskingServiceFactory.create(
+                use_preprocessor=use_preprocessor,
+                use_ner=use_ner,
+                cache_dir=cache_dir
+            )
         
         # Delegate to MaskingService
         service.process_file(
@@ -53,3 +63,87 @@ def process_file(
         
     except Exception as e:
         print(f"Error processing {input_path.name}: {e}", file=sys.stderr)
+
+
+@lru_cache(maxsize=4)
+def _get_worker_service(
+    use_preprocessor: bool, use_ner: bool, cache_dir: Path | None = None
+) -> MaskingService:
+    """Return this process's MaskingService, built on first use."""
+    return MaskingServiceFactory.create(
+        use_preprocessor=use_preprocessor,
+        use_ner=use_ner,
+        cache_dir=cache_dir
+    )
+
+
+def process_one_file(
+    input_path: Path,
+    output_path: Path,
+    log_path: Path,
+    language: str,
+    verbose: bool,
+    use_preprocessor: bool = False,
+    use_ner: bool = False,
+    cache_dir: Path | None = None
+) -> None:
+    """
+    Worker entry point for process_files.
+    
+    Top-level (picklable) so it can run in a ProcessPoolExecutor. Each
+    worker process loads its models once and reuses them for every file
+    it is given.
+    """
+    process_file(
+        input_path, output_path, log_path, language, verbose,
+        service=_get_worker_service(use_preprocessor, use_ner, cache_dir)
+    )
+
+
+def process_files(
+    jobs: list[tuple[Path, Path, Path]],
+    language: str,
+    verbose: bool,
+    use_preprocessor: bool = False,
+    use_ner: bool = False,
+    workers: int = 1,
+    cache_dir: Path | None = None
+) -> None:
+    """
+    Process many files, optionally in parallel worker processes.
+    
+    Args:
+        jobs: (input_path, output_path, log_path) per file
+        language: Language code ("en", "ja", or "auto")
+        verbose: If True, print detected entities
+        use_preprocessor: If True, use structure-aware TextPreprocessor pipeline
+        use_ner: If True (with use_preprocessor), enable NER engines
+        workers: Number of worker processes. 1 runs in this process and
+            analyzes all documents in one batch (MaskingService.process_files).
+            Each worker holds its own copy of the spaCy/GiNZA models, so
+            memory grows with the worker count.
+        cache_dir: Directory for cached masking results (None = no cache)
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        # Single process: analyze all documents in one batch
+        try:
+            service = _get_worker_service(use_preprocessor, use_ner, cache_dir)
+            service.process_files(jobs, language=language, verbose=verbose)
+        except Exception as e:
+            print(f"Error processing batch: {e}", file=sys.stderr)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                process_one_file,
+                input_path, output_path, log_path, language, verbose,
+                use_preprocessor, use_ner, cache_dir
+            ): input_path
+            for input_path, output_path, log_path in jobs
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error processing {futures[future].name}: {e}", file=sys.stderr)
@@ -16,12 +16,10 @@ Target PII types (8):
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
-from file_io.file_processor import process_file
-from recognizers import create_default_registry
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -70,6 +68,19 @@ Examples:
         action="store_true",
         help="Enable NER engines (GiNZA/Transformer) with preprocessor"
     )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for batch mode (each loads its own models; default: 1)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Reuse masking results for unchanged documents from this directory "
+             "(cache files contain the detected PII in plain text; protect accordingly)"
+    )
     parser.add_argument(
         "--show-recognizers",
         action="store_true",
@@ -77,6 +88,11 @@ Examples:
     )
     args = parser.parse_args()
 
+    # Heavy imports (Presidio, spaCy support, extractors) only after argument
+    # parsing, so --help and usage errors return immediately.
+    from file_io.file_processor import process_file, process_files
+    from recognizers import create_default_registry
+
     # Handle --show-recognizers
     if args.show_recognizers:
         registry = create_default_registry(use_ginza=True)
@@ -101,7 +117,8 @@ Examples:
 
         process_file(
             input_path, output_path, log_path, args.lang, args.verbose,
-            use_preprocessor=args.use_preprocessor, use_ner=args.use_ner
+            use_preprocessor=args.use_preprocessor, use_ner=args.use_ner,
+            cache_dir=args.cache_dir
         )
 
     else:
@@ -111,23 +128,14 @@ Examples:
         output_dir = root_dir / "output"
         output_dir.mkdir(exist_ok=True)
 
-        # Extensions to look for (only PDF and DOCX)
-        extensions = ["*.pdf", "*.docx"]
-        files_to_process = []
-
-        for ext in extensions:
-            files_to_process.extend(root_dir.glob(ext))
-
-        # Filter out files in output directory and __pycache__ etc
-        files_to_process = [
-            f for f in files_to_process
-            if "output" not in f.parts
-            and ".git" not in f.parts
-            and "__pycache__" not in f.parts
-            and "venv" not in f.parts
-            and f.name != "requirements.txt"
-            and f.name != "masking_log.txt"
-        ]
+        # Extensions to look for (only PDF and DOCX, case-insensitive).
+        # One directory scan instead of one glob pass per extension.
+        extensions = {".pdf", ".docx"}
+        with os.scandir(root_dir) as entries:
+            files_to_process = sorted(
+                Path(entry.path) for entry in entries
+                if entry.is_file() and Path(entry.name).suffix.lower() in extensions
+            )
 
         if not files_to_process:
             print("No compatible files found to process.", file=sys.stderr)
@@ -135,17 +143,17 @@ Examples:
 
         print(f"Found {len(files_to_process)} files.", file=sys.stderr)
 
-        for input_path in files_to_process:
-            # Determine output paths
-            stem = input_path.stem
-            processed_output_path = output_dir / f"{stem}.txt"
-            processed_log_path = output_dir / f"{stem}_log.txt"
+        jobs = [
+            (input_path, output_dir / f"{input_path.stem}.txt", output_dir / f"{input_path.stem}_log.txt")
+            for input_path in files_to_process
+        ]
 
-            process_file(
-                input_path, processed_output_path, processed_log_path,
-                args.lang, args.verbose,
-                use_preprocessor=args.use_preprocessor, use_ner=args.use_ner
-            )
+        # Engines are built once per process (once in total when --workers is 1)
+        process_files(
+            jobs, args.lang, args.verbose,
+            use_preprocessor=args.use_preprocessor, use_ner=args.use_ner,
+            workers=args.workers, cache_dir=args.cache_dir
+        )
 
         print(f"\nBatch processing complete. Results in '{output_dir.absolute()}'", file=sys.stderr)
 
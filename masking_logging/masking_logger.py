@@ -7,9 +7,34 @@ NOTE: Singleton pattern removed for testability. Use dependency injection
 to share logger instances across components.
 """
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Active QueueListener per logger name. logging.getLogger(name) is shared,
+# so a listener started by one MaskingLogger must be stoppable by another
+# instance using the same name.
+_listeners: dict[str, QueueListener] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Drain queued records for the named logger to its file and close it."""
+    listener = _listeners.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    """Flush every queued log file at interpreter exit."""
+    for name in list(_listeners):
+        _stop_listener(name)
+
 
 class MaskingLogger:
     """
@@ -19,6 +44,7 @@ class MaskingLogger:
     - Writing masked entity logs to file
     - Dynamic log file switching for batch processing
     - Configurable log format
+    - Optional queued mode: file writes happen on a background thread
     
     Usage:
         logger = MaskingLogger()
@@ -26,12 +52,18 @@ class MaskingLogger:
         logger.log("Message")
     """
 
-    def __init__(self, name: str = "masking"):
+    def __init__(self, name: str = "masking", queued: bool = False):
         """Initialize logger with a unique name.
         
         Args:
             name: Logger name (default: "masking")
+            queued: If True, log() only enqueues the record and a
+                QueueListener thread writes it to the file, keeping disk
+                I/O off the masking path. Pending records are flushed when
+                the log file is switched, on flush() and close(), and at
+                interpreter exit.
         """
+        self._queued = queued
         self._logger = logging.getLogger(name)
         self._logger.setLevel(logging.INFO)
         # Prevent duplicate handlers if logger already exists
@@ -44,24 +76,70 @@ class MaskingLogger:
         """Get the underlying logger instance."""
         return self._logger
 
+    @property
+    def enabled(self) -> bool:
+        """Whether a logged message would reach a real (non-Null) handler.
+        
+        Lets callers skip formatting log output that would be discarded.
+        """
+        if not self._logger.isEnabledFor(logging.INFO):
+            return False
+        logger = self._logger
+        while logger:
+            if any(not isinstance(h, logging.NullHandler) for h in logger.handlers):
+                return True
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        return False
+
     def setup_file_handler(self, log_file_path: Path) -> None:
         """
         Set up the logger to write to the specified file.
         Removes existing handlers to switch log files dynamically.
+        The file is opened (and created) on the first logged message.
         
         Args:
             log_file_path: Path to the log file
         """
+        # Finish writing the previous file before switching, including one
+        # queued by another instance sharing this logger name
+        _stop_listener(self._logger.name)
+        
         # Remove existing handlers (except NullHandler)
         for handler in self._logger.handlers[:]:
             if not isinstance(handler, logging.NullHandler):
                 handler.close()
                 self._logger.removeHandler(handler)
 
-        # Add new handler
-        file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
+        # Add new handler. delay=True defers opening the file until the
+        # first record is written, so documents with nothing to log never
+        # touch the filesystem.
+        file_handler = logging.FileHandler(log_file_path, encoding="utf-8", delay=True)
         file_handler.setFormatter(logging.Formatter("%(message)s"))
-        self._logger.addHandler(file_handler)
+        if self._queued:
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            _listeners[self._logger.name] = listener
+            self._logger.addHandler(QueueHandler(log_queue))
+        else:
+            self._logger.addHandler(file_handler)
+
+    def flush(self) -> None:
+        """Write every queued record to the current log file now.
+        
+        atexit does not run in ProcessPoolExecutor workers (they leave via
+        os._exit), so callers flush after each document instead of relying
+        on the exit hook.
+        """
+        listener = _listeners.get(self._logger.name)
+        if listener is not None:
+            # stop() drains the queue and joins the thread; start() resumes
+            listener.stop()
+            listener.start()
+        for handler in self._logger.handlers:
+            handler.flush()
 
     def log(self, message: str) -> None:
         """
@@ -78,6 +156,7 @@ class MaskingLogger:
 
     def close(self) -> None:
         """Close all handlers. Useful for cleanup in tests."""
+        _stop_listener(self._logger.name)
         for handler in self._logger.handlers[:]:
             handler.close()
             self._logger.removeHandler(handler)
@@ -30,19 +30,14 @@ import logging
 import re
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from importlib.util import find_spec
 from typing import Any
 
 from presidio_analyzer import EntityRecognizer, RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
-try:
-    import torch
-    from transformers import AutoModelForCausalLM, AutoTokenizer
-
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
-    torch = None
+# torch/transformers are imported on first model load (see _ensure_model_loaded).
+TORCH_AVAILABLE = find_spec("torch") is not None and find_spec("transformers") is not None
 
 
 _MASKING_LOGGER_NAME = "masking"
@@ -225,6 +220,9 @@ class GPTPIIMaskerRecognizer(EntityRecognizer):
         if self._model is not None and self._tokenizer is not None:
             return
 
+        import torch
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+
         if self.require_gpu and (not torch.cuda.is_available()):
             raise RuntimeError(
                 "GPTPIIMaskerRecognizer requires CUDA GPU in production, "
@@ -270,6 +268,8 @@ class GPTPIIMaskerRecognizer(EntityRecognizer):
         input_text = instruction + original_text + "<SEP>"
         input_text = _preprocess(input_text)
 
+        import torch
+
         with torch.no_grad():
             token_ids = self._tokenizer.encode(
                 input_text, add_special_tokens=False, return_tensors="pt"
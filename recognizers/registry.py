@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import warnings
 from dataclasses import dataclass
+from importlib.util import find_spec
 from typing import Any, Literal
 
 from presidio_analyzer import AnalyzerEngine, EntityRecognizer
@@ -19,15 +20,12 @@ from recognizers.japanese_patterns import (
     JapaneseZipCodeRecognizer,
 )
 
-# Try to import GiNZA recognizers (optional)
+# GiNZA recognizers (optional). Probe for spaCy without importing it;
+# the model itself is loaded by the NLP engine only when an analyzer needs it.
 GINZA_AVAILABLE = False
-try:
-    import spacy
-
+if find_spec("spacy") is not None:
     from recognizers.japanese_ner import GinzaAddressRecognizer, GinzaPersonRecognizer
     GINZA_AVAILABLE = True
-except ImportError:
-    pass
 
 # Try to import Transformer recognizers
 TRANSFORMER_AVAILABLE = False
@@ -49,6 +47,17 @@ try:
 except ImportError:
     pass
 
+# Pattern-based recognizers (Japanese): (class, entity_type, description)
+_PATTERN_RECOGNIZERS: tuple[tuple[type[EntityRecognizer], str, str], ...] = (
+    (JapanesePhoneRecognizer, "PHONE_NUMBER_JP", "Japanese phone numbers (正規表現)"),
+    (JapaneseZipCodeRecognizer, "JP_ZIP_CODE", "Japanese postal codes (〒XXX-XXXX)"),
+    (JapaneseBirthDateRecognizer, "DATE_OF_BIRTH_JP", "Japanese birth dates (生年月日パターン)"),
+    (JapaneseNameRecognizer, "JP_PERSON", "Japanese names (コンテキストベース)"),
+    (JapaneseAgeRecognizer, "JP_AGE", "Age mentions (XX歳)"),
+    (JapaneseGenderRecognizer, "JP_GENDER", "Gender (性別: 男/女)"),
+    (JapaneseAddressRecognizer, "JP_ADDRESS", "Japanese addresses (都道府県パターン)"),
+)
+
 RecognizerType = Literal["pattern", "ner_ginza", "ner_presidio", "ner_transformer", "ner_gpt_masker"]
 
 
@@ -169,68 +178,17 @@ def create_default_registry(
     transformer_section = app_config.get("transformer", {})
 
     # === Pattern-based recognizers (Japanese) ===
-    registry.register(RecognizerConfig(
-        recognizer=JapanesePhoneRecognizer(),
-        type="pattern",
-        language="ja",
-        entity_type="PHONE_NUMBER_JP",
-        description="Japanese phone numbers (正規表現)",
-        requires_nlp=False
-    ))
-
-    registry.register(RecognizerConfig(
-        recognizer=JapaneseZipCodeRecognizer(),
-        type="pattern",
-        language="ja",
-        entity_type="JP_ZIP_CODE",
-        description="Japanese postal codes (〒XXX-XXXX)",
-        requires_nlp=False
-    ))
-
-    registry.register(RecognizerConfig(
-        recognizer=JapaneseBirthDateRecognizer(),
-        type="pattern",
-        language="ja",
-        entity_type="DATE_OF_BIRTH_JP",
-        description="Japanese birth dates (生年月日パターン)",
-        requires_nlp=False
-    ))
-
-    registry.register(RecognizerConfig(
-        recognizer=JapaneseNameRecognizer(),
-        type="pattern",
-        language="ja",
-        entity_type="JP_PERSON",
-        description="Japanese names (コンテキストベース)",
-        requires_nlp=False
-    ))
-
-    registry.register(RecognizerConfig(
-        recognizer=JapaneseAgeRecognizer(),
-        type="pattern",
-        language="ja",
-        entity_type="JP_AGE",
-        description="Age mentions (XX歳)",
-        requires_nlp=False
-    ))
-
-    registry.register(RecognizerConfig(
-        recognizer=JapaneseGenderRecognizer(),
-        type="pattern",
-        language="ja",
-        entity_type="JP_GENDER",
-        description="Gender (性別: 男/女)",
-        requires_nlp=False
-    ))
-
-    registry.register(RecognizerConfig(
-        recognizer=JapaneseAddressRecognizer(),
-        type="pattern",
-        language="ja",
-        entity_type="JP_ADDRESS",
-        description="Japanese addresses (都道府県パターン)",
-        requires_nlp=False
-    ))
+    # Construction is pure Python (GIL-bound), so a plain loop over the table
+    # is as fast as a thread pool and keeps registration order deterministic.
+    for recognizer_cls, entity_type, description in _PATTERN_RECOGNIZERS:
+        registry.register(RecognizerConfig(
+            recognizer=recognizer_cls(),
+            type="pattern",
+            language="ja",
+            entity_type=entity_type,
+            description=description,
+            requires_nlp=False
+        ))
 
     # === GiNZA-based recognizers (if available) ===
     if use_ginza and GINZA_AVAILABLE:
@@ -307,7 +265,7 @@ def create_transformer_recognizer(
     Args:
         model_config: モデル設定 (model_name, tokenizer_name, entities, label_mapping)
         language: 言語コード ("en" or "ja")
-        transformer_config: Transformer全体設定 (min_confidence, device)
+        transformer_config: Transformer全体設定 (min_confidence, device, batch_size, fp16, int8)
         model_id: モデルID（ロギング・識別用、省略可）
         
     Returns:
@@ -319,6 +277,7 @@ def create_transformer_recognizer(
         label_mapping = transformer_config.get("label_mapping", {}).get(language, {})
 
     model_name = model_config.get("model_name")
+    device = transformer_config.get("device", "cpu")
     if model_id:
         import logging
         logger = logging.getLogger(__name__)
@@ -330,8 +289,11 @@ def create_transformer_recognizer(
         supported_language=language,
         supported_entities=model_config.get("entities", []),
         min_confidence=transformer_config.get("min_confidence", 0.8),
-        device=transformer_config.get("device", "cpu"),
-        label_mapping=label_mapping
+        device=device,
+        label_mapping=label_mapping,
+        batch_size=transformer_config.get("batch_size", 16),
+        fp16=transformer_config.get("fp16", device.startswith("cuda")),
+        int8=transformer_config.get("int8", False)
     )
 
 
@@ -1,17 +1,15 @@
 """Transformer-based NER recognizers using Hugging Face models."""
 
-
-try:
-    import torch
-    from transformers import AutoModelForTokenClassification, AutoTokenizer
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
-    torch = None
+from importlib.util import find_spec
 
 from presidio_analyzer import EntityRecognizer, RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
+# torch/transformers take seconds to import; only probe for them here and
+# import them when a model is actually loaded. A broken install (package
+# present but failing to import) therefore only fails at model load time.
+TORCH_AVAILABLE = find_spec("torch") is not None and find_spec("transformers") is not None
+
 
 class TransformerNERRecognizer(EntityRecognizer):
     """
@@ -32,7 +30,10 @@ class TransformerNERRecognizer(EntityRecognizer):
         min_confidence: float = 0.8,
         device: str = "cpu",
         tokenizer_name: str | None = None,
-        label_mapping: dict[str, str] | None = None
+        label_mapping: dict[str, str] | None = None,
+        batch_size: int = 16,
+        fp16: bool = False,
+        int8: bool = False
     ):
         """
         Args:
@@ -43,6 +44,9 @@ class TransformerNERRecognizer(EntityRecognizer):
             device: "cpu" or "cuda"
             tokenizer_name: トークナイザー名(Noneの場合はmodel_nameと同じ)
             label_mapping: BIOタグ→エンティティタイプのマッピング (config.yamlから渡される)
+            batch_size: analyze_batch で一度に推論するテキスト数
+            fp16: CUDA 使用時に float16 でモデルを読み込む (CPU では無視)
+            int8: CPU 使用時に Linear 層を int8 に動的量子化する (CUDA では無視)
         """
         if not TORCH_AVAILABLE:
             raise ImportError("torch and transformers are required for TransformerNERRecognizer")
@@ -54,6 +58,9 @@ class TransformerNERRecognizer(EntityRecognizer):
         self._model = None
         self._tokenizer = None
         self.label_mapping = label_mapping or {}
+        self.batch_size = max(1, int(batch_size))
+        self.fp16 = fp16
+        self.int8 = int8
 
         # supported_entities が指定されていない場合はエラー (設定から渡すべき)
         if supported_entities is None:
@@ -67,6 +74,8 @@ class TransformerNERRecognizer(EntityRecognizer):
     def load(self) -> None:
         """モデルとトークナイザーの遅延読み込み"""
         if self._model is None:
+            from transformers import AutoModelForTokenClassification, AutoTokenizer
+
             # Fast tokenizerを優先して使用 (offset_mapping対応)
             try:
                 self._tokenizer = AutoTokenizer.from_pretrained(
@@ -77,10 +86,27 @@ class TransformerNERRecognizer(EntityRecognizer):
                 # Fallback to slow tokenizer
                 self._tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_name)
 
-            self._model = AutoModelForTokenClassification.from_pretrained(self.model_name)
+            model_kwargs = {}
+            if self.fp16 and str(self.device).startswith("cuda"):
+                import torch
+
+                # 推論はメモリ帯域律速のため、GPU では半精度で約2倍速
+                model_kwargs["torch_dtype"] = torch.float16
+            self._model = AutoModelForTokenClassification.from_pretrained(
+                self.model_name, **model_kwargs
+            )
             self._model.to(self.device)
             self._model.eval()
 
+            if self.int8 and str(self.device) == "cpu":
+                import torch
+
+                # CPU 推論も重みの読み出しが律速。Linear 層の重みを int8 にすると
+                # メモリ帯域が約1/4になり、精度低下はわずか
+                self._model = torch.ao.quantization.quantize_dynamic(
+                    self._model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+
     def analyze(
         self, text: str, entities: list[str], nlp_artifacts: NlpArtifacts | None = None
     ) -> list[RecognizerResult]:
@@ -129,6 +155,8 @@ class TransformerNERRecognizer(EntityRecognizer):
 
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
 
+        import torch
+
         # 推論
         with torch.no_grad():
             outputs = self._model(**inputs)
@@ -149,7 +177,70 @@ class TransformerNERRecognizer(EntityRecognizer):
                 label_ids, scores, text
             )
 
-        # フィルタリング
+        return self._to_results(entities_found, requested_entities)
+
+    def analyze_batch(
+        self, texts: list[str], entities: list[str]
+    ) -> list[list[RecognizerResult]]:
+        """
+        複数テキストを batch_size 件ずつまとめて推論
+        
+        1テキストずつ analyze() を呼ぶより、特に GPU ではパディング付きの
+        バッチ推論の方が桁違いに速い。
+        
+        Args:
+            texts: 解析対象テキストのリスト
+            entities: 検出対象エンティティリスト
+            
+        Returns:
+            texts と同じ順序の RecognizerResult リストのリスト
+        """
+        self.load()
+
+        requested_entities = set(entities) & set(self.supported_entities)
+        if not requested_entities:
+            return [[] for _ in texts]
+
+        # offset_mapping は Fast tokenizer のみ対応。非対応なら1件ずつ処理
+        if not getattr(self._tokenizer, "is_fast", False):
+            return [self.analyze(text, entities) for text in texts]
+
+        import torch
+
+        results: list[list[RecognizerResult]] = []
+        for i in range(0, len(texts), self.batch_size):
+            chunk = texts[i:i + self.batch_size]
+            inputs = self._tokenizer(
+                chunk,
+                return_tensors="pt",
+                truncation=True,
+                max_length=512,
+                return_offsets_mapping=True,
+                padding=True
+            )
+            offset_mappings = inputs.pop("offset_mapping")
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+
+            with torch.no_grad():
+                outputs = self._model(**inputs)
+                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+
+            label_ids = predictions.argmax(dim=-1).cpu().numpy()
+            scores = predictions.max(dim=-1).values.cpu().numpy()
+
+            # パディングトークンは offset (0, 0) なので _build_entities でスキップされる
+            for row, text in enumerate(chunk):
+                entities_found = self._build_entities(
+                    label_ids[row], scores[row], offset_mappings[row], text
+                )
+                results.append(self._to_results(entities_found, requested_entities))
+
+        return results
+
+    def _to_results(
+        self, entities_found: list[dict], requested_entities: set[str]
+    ) -> list[RecognizerResult]:
+        """要求エンティティかつ min_confidence 以上のものを RecognizerResult に変換"""
         results = []
         for entity in entities_found:
             if (entity["entity_type"] in requested_entities and
@@ -0,0 +1,49 @@
+"""Log output of the multi-process batch path (process_files with workers > 1)."""
+
+import pytest
+
+from core.masking_result import EntityInfo, MaskingResult
+from core.masking_service import MaskingServiceFactory
+from file_io.file_processor import process_files
+
+docx = pytest.importorskip("docx")
+
+
+def _write_docx(path, text):
+    document = docx.Document()
+    document.add_paragraph(text)
+    document.save(path)
+
+
+def test_worker_logs_are_complete(tmp_path):
+    """Each worker's queued log records reach the file before the worker exits.
+
+    Results are pre-cached, so the workers log entities without loading
+    any NLP model.
+    """
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    service = MaskingServiceFactory.create(cache_dir=cache_dir)
+
+    jobs = []
+    for name in ("first", "second"):
+        text = f"{name} 090-1234-5678"
+        input_path = tmp_path / f"{name}.docx"
+        _write_docx(input_path, text)
+        # Seed the cache with the text exactly as the extractor returns it
+        extracted = service.extractor.extract(str(input_path))
+        start = extracted.index("090")
+        entity = EntityInfo("PHONE_NUMBER", extracted[start:start + 13], 0.9, start, start + 13)
+        service._store_cached(
+            extracted, "ja",
+            MaskingResult.from_entities(extracted.replace(entity.text, "****"), (entity,))
+        )
+        jobs.append((input_path, tmp_path / f"{name}.txt", tmp_path / f"{name}_log.txt"))
+
+    process_files(jobs, language="ja", verbose=False, workers=2, cache_dir=cache_dir)
+
+    for _, output_path, log_path in jobs:
+        assert "****" in output_path.read_text(encoding="utf-8")
+        log = log_path.read_text(encoding="utf-8")
+        assert '[PHONE_NUMBER] "090-1234-5678"' in log
+        assert "Total: 1 entities masked" in log
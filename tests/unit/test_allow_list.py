@@ -1,5 +1,6 @@
 """Unit tests for allow list functionality."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -60,6 +61,16 @@ class TestParseDictionary:
         finally:
             Path(f.name).unlink()
 
+    def test_parse_suffixes_in_any_order(self, tmp_path):
+        """Test that /js[...] before /alias[...] and trailing text still parse."""
+        dict_path = tmp_path / "terms.dic"
+        dict_path.write_text(
+            "Foo/js[フー]/alias[Bar]\nBaz/alias[Qux] extra\n", encoding="utf-8"
+        )
+
+        terms = parse_dictionary(dict_path)
+        assert terms == ["Foo", "Bar", "フー", "Baz", "Qux"]
+
     def test_parse_real_dictionary(self):
         """Test parsing the actual softwaretec.dic file."""
         dict_path = Path(__file__).parent.parent.parent / "doc" / "softwaretec.dic"
@@ -94,6 +105,27 @@ class TestParseDictionary:
         finally:
             Path(f.name).unlink()
 
+    def test_parse_is_cached_until_file_changes(self, tmp_path):
+        """An unchanged file is parsed once; an edited file is re-read."""
+        from core.allow_list import _parse_dictionary_cached
+
+        dict_path = tmp_path / "terms.dic"
+        dict_path.write_text("Python\n", encoding="utf-8")
+
+        first = parse_dictionary(dict_path)
+        hits_before = _parse_dictionary_cached.cache_info().hits
+        second = parse_dictionary(dict_path)
+        assert _parse_dictionary_cached.cache_info().hits == hits_before + 1
+        assert first == second == ["Python"]
+
+        # Returned lists are copies; mutating one does not touch the cache
+        first.append("Mutated")
+        assert parse_dictionary(dict_path) == ["Python"]
+
+        dict_path.write_text("Python\nDocker\n", encoding="utf-8")
+        os.utime(dict_path, ns=(0, dict_path.stat().st_mtime_ns + 1_000_000))
+        assert parse_dictionary(dict_path) == ["Python", "Docker"]
+
     def test_parse_nonexistent_file(self):
         """Test that nonexistent file returns empty list."""
         terms = parse_dictionary("/nonexistent/path.dic")
@@ -126,3 +158,25 @@ class TestGetAllowList:
         terms = get_allow_list(config)
         assert "CustomTerm1" in terms
         assert "CustomTerm2" in terms
+
+    def test_allow_list_cached_per_settings(self, tmp_path):
+        """Same settings reuse the combined list; returned lists are copies."""
+        from core.allow_list import _allow_list_for
+
+        dict_path = tmp_path / "terms.dic"
+        dict_path.write_text("Python\n", encoding="utf-8")
+        config = {
+            "allow_list": {
+                "enabled": True,
+                "dictionary_path": str(dict_path),
+                "additional_terms": ["CustomTerm"]
+            }
+        }
+
+        first = get_allow_list(config)
+        hits_before = _allow_list_for.cache_info().hits
+        second = get_allow_list(config)
+
+        assert _allow_list_for.cache_info().hits == hits_before + 1
+        assert first == second == ["Python", "CustomTerm"]
+        assert first is not second
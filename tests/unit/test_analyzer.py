@@ -0,0 +1,350 @@
+"""Unit tests for core.analyzer factory helpers.
+
+These tests do NOT load real spaCy models.
+NlpEngineProvider is monkeypatched (at its Presidio import location,
+since core.analyzer imports it lazily) to count engine creations.
+"""
+
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+import core.analyzer as analyzer_module
+
+
+class _CountingProvider:
+    """Stand-in for NlpEngineProvider that records created engines."""
+
+    created: ClassVar[list] = []
+
+    def __init__(self, nlp_configuration, nlp_engines=None):
+        self.nlp_configuration = nlp_configuration
+        self.nlp_engines = nlp_engines
+
+    def create_engine(self):
+        engine = object()
+        _CountingProvider.created.append((self.nlp_configuration, engine))
+        return engine
+
+
+@pytest.fixture
+def counting_provider(monkeypatch):
+    """Patch NlpEngineProvider and clear the engine cache around each test."""
+    _CountingProvider.created = []
+    monkeypatch.setattr("presidio_analyzer.nlp_engine.NlpEngineProvider", _CountingProvider)
+    analyzer_module.get_nlp_engine.cache_clear()
+    yield _CountingProvider
+    analyzer_module.get_nlp_engine.cache_clear()
+
+
+def _modules_loaded_by(statement: str, modules: tuple[str, ...]) -> list[str]:
+    """Run statement in a fresh interpreter and list which of modules it loaded."""
+    code = f"import sys; {statement}; print(','.join(m for m in {modules!r} if m in sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    return [m for m in output.split(",") if m]
+
+
+class TestLazyImports:
+    """Importing core.analyzer must not load Presidio or the recognizer stack."""
+
+    @pytest.mark.parametrize("module", ["core.analyzer", "core.allow_list", "core.cache_keys"])
+    def test_import_is_cheap(self, module):
+        """core.analyzer and its light neighbours defer Presidio to first use."""
+        loaded = _modules_loaded_by(
+            f"import {module}",
+            ("presidio_analyzer", "spacy", "torch", "core.masker", "recognizers.registry"),
+        )
+        assert loaded == []
+
+    def test_factory_loads_presidio_on_first_use(self):
+        """Presidio is imported by the factories themselves."""
+        loaded = _modules_loaded_by(
+            "import core.analyzer as a; a._create_pattern_only_analyzer('en')",
+            ("presidio_analyzer",),
+        )
+        assert loaded == ["presidio_analyzer"]
+
+    def test_core_package_exports_resolve_lazily(self):
+        """core.Masker is still importable from the package."""
+        loaded = _modules_loaded_by("from core import Masker", ("core.masker",))
+        assert loaded == ["core.masker"]
+
+
+class TestNlpEngineCache:
+    """Tests for the shared NLP engine cache."""
+
+    def test_same_models_share_engine(self, counting_provider):
+        """Same model set should be loaded only once."""
+        models = (("en", "en_core_web_lg"), ("ja", "ja_ginza"))
+
+        first = analyzer_module.get_nlp_engine(models)
+        second = analyzer_module.get_nlp_engine(models)
+
+        assert first is second
+        assert len(counting_provider.created) == 1
+
+    def test_different_models_get_separate_engines(self, counting_provider):
+        """Different model sets should not share an engine."""
+        en_only = analyzer_module.get_nlp_engine((("en", "en_core_web_lg"),))
+        both = analyzer_module.get_nlp_engine((("en", "en_core_web_lg"), ("ja", "ja_ginza")))
+
+        assert en_only is not both
+        assert len(counting_provider.created) == 2
+
+    def test_configuration_passed_to_provider(self, counting_provider):
+        """Models should be expanded back into Presidio's configuration format."""
+        analyzer_module.get_nlp_engine((("ja", "ja_ginza"),))
+
+        nlp_configuration, _ = counting_provider.created[0]
+        assert nlp_configuration["nlp_engine_name"] == "spacy"
+        assert nlp_configuration["models"][0]["lang_code"] == "ja"
+        assert nlp_configuration["models"][0]["model_name"] == "ja_ginza"
+
+    def test_ner_configuration_is_frozen_and_copied(self, counting_provider):
+        """The shared label mapping is read-only; Presidio gets a plain dict."""
+        analyzer_module.get_nlp_engine((("en", "en_core_web_sm"),))
+
+        nlp_configuration, _ = counting_provider.created[0]
+        ner_config = nlp_configuration["ner_model_configuration"]
+        assert type(ner_config["model_to_presidio_entity_mapping"]) is dict
+        assert ner_config["model_to_presidio_entity_mapping"]["GPE"] == "LOCATION"
+        with pytest.raises(TypeError):
+            analyzer_module._NER_MODEL_CONFIGURATION["labels_to_ignore"] = ["X"]
+
+    def test_unused_components_disabled(self, counting_provider):
+        """Parser-based components should be disabled; NER and lemmas kept."""
+        analyzer_module.get_nlp_engine((("en", "en_core_web_lg"), ("ja", "ja_ginza")))
+
+        nlp_configuration, _ = counting_provider.created[0]
+        disabled = {m["model_name"]: m["disable"] for m in nlp_configuration["models"]}
+        assert "parser" in disabled["ja_ginza"]
+        assert "parser" in disabled["en_core_web_lg"]
+        for model_disabled in disabled.values():
+            assert "ner" not in model_disabled
+            assert "lemmatizer" not in model_disabled
+
+    def test_disabled_components_lookup(self):
+        """Known models list their skipped pipes; unknown models skip none."""
+        assert analyzer_module.disabled_components("ja_ginza") == ("parser", "bunsetu_recognizer")
+        assert analyzer_module.disabled_components("xx_custom_model") == ()
+
+
+class TestTrimmedSpacyNlpEngine:
+    """Tests for TrimmedSpacyNlpEngine.load on a blank on-disk pipeline."""
+
+    def test_shared_model_loaded_once_with_components_disabled(self, tmp_path):
+        """Languages naming one model share a Language with its pipes disabled."""
+        spacy = pytest.importorskip("spacy")
+        from core.nlp_engine import TrimmedSpacyNlpEngine
+
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        nlp.to_disk(tmp_path)
+
+        engine = TrimmedSpacyNlpEngine(models=[
+            {"lang_code": "en", "model_name": str(tmp_path), "disable": ["sentencizer"]},
+            {"lang_code": "ja", "model_name": str(tmp_path), "disable": ["sentencizer"]},
+        ])
+        engine.load()
+
+        assert engine.nlp["en"] is engine.nlp["ja"]
+        assert engine.nlp["en"].disabled == ["sentencizer"]
+        assert len(engine.models) == 2
+
+
+class TestRegistryCache:
+    """Tests for the shared recognizer registry cache."""
+
+    @pytest.fixture
+    def counting_registry(self, monkeypatch):
+        """Patch create_default_registry to count registry constructions."""
+        calls = []
+
+        def fake_create_default_registry(**kwargs):
+            calls.append(kwargs)
+            return object()
+
+        monkeypatch.setattr("recognizers.registry.create_default_registry", fake_create_default_registry)
+        analyzer_module._cached_registry.cache_clear()
+        yield calls
+        analyzer_module._cached_registry.cache_clear()
+
+    def test_same_flags_share_registry(self, counting_registry):
+        """Same flags should construct the registry only once."""
+        first = analyzer_module.get_registry(True, False, None)
+        second = analyzer_module.get_registry(True, False, None)
+
+        assert first is second
+        assert len(counting_registry) == 1
+
+    def test_different_flags_get_separate_registries(self, counting_registry):
+        """Different flags should not share a registry."""
+        with_ginza = analyzer_module.get_registry(True, False, None)
+        without_ginza = analyzer_module.get_registry(False, False, None)
+
+        assert with_ginza is not without_ginza
+        assert len(counting_registry) == 2
+
+    def test_equal_transformer_configs_share_registry(self, counting_registry):
+        """Equal transformer_config dicts should hit the same cache entry."""
+        first = analyzer_module.get_registry(False, True, {"device": "cpu", "label_mapping": {"en": {}}})
+        second = analyzer_module.get_registry(False, True, {"label_mapping": {"en": {}}, "device": "cpu"})
+
+        assert first is second
+        assert counting_registry[0]["transformer_config"] == {"device": "cpu", "label_mapping": {"en": {}}}
+
+
+class TestModelSelection:
+    """Tests for choosing spaCy models by size."""
+
+    def test_en_model_by_size(self):
+        """nlp_size maps onto en_core_web_{sm,md,lg}."""
+        assert analyzer_module._en_model("sm") == "en_core_web_sm"
+        assert analyzer_module._en_model("lg") == "en_core_web_lg"
+
+    def test_unknown_size_rejected(self):
+        """An unknown nlp_size raises ValueError."""
+        with pytest.raises(ValueError):
+            analyzer_module._en_model("xl")
+
+    def test_ja_fallback_reuses_english_model(self):
+        """Without GiNZA the "ja" slot reuses the English model (no extra model)."""
+        models = analyzer_module._bilingual_models(use_ginza=False, nlp_size="lg")
+
+        assert models == (("en", "en_core_web_lg"), ("ja", "en_core_web_lg"))
+
+    def test_pattern_only_falls_back_to_large_model(self, monkeypatch):
+        """A pattern-only Japanese analyzer uses en_core_web_lg when sm cannot load."""
+        requested = []
+
+        def fake_engine_or_none(models):
+            requested.append(models)
+            return None
+
+        class _Registry:
+            def apply_to_analyzer(self, analyzer, language=None):
+                pass
+
+        monkeypatch.setattr(analyzer_module, "get_nlp_engine_or_none", fake_engine_or_none)
+        monkeypatch.setattr(analyzer_module, "get_registry", lambda *args: _Registry())
+        monkeypatch.setattr("presidio_analyzer.AnalyzerEngine", lambda **kwargs: object())
+
+        analyzer_module.create_japanese_analyzer(use_ginza=False)
+
+        assert requested == [
+            (("en", "en_core_web_sm"), ("ja", "en_core_web_sm")),
+            (("en", "en_core_web_lg"), ("ja", "en_core_web_lg")),
+        ]
+
+
+class TestNlpEngineFallback:
+    """Tests for the memoized load failure in get_nlp_engine_or_none."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        analyzer_module.get_nlp_engine.cache_clear()
+        analyzer_module.get_nlp_engine_or_none.cache_clear()
+        yield
+        analyzer_module.get_nlp_engine.cache_clear()
+        analyzer_module.get_nlp_engine_or_none.cache_clear()
+
+    def test_failed_load_tried_and_logged_once(self, monkeypatch, caplog):
+        """A failing load (e.g. model download) is attempted and reported once."""
+        attempts = []
+
+        class _FailingProvider:
+            def __init__(self, nlp_configuration, nlp_engines=None):
+                pass
+
+            def create_engine(self):
+                attempts.append(1)
+                raise OSError("download failed")
+
+        monkeypatch.setattr("presidio_analyzer.nlp_engine.NlpEngineProvider", _FailingProvider)
+        models = (("ja", "no_such_spacy_model_pkg"),)
+
+        with caplog.at_level(logging.WARNING, logger="core.analyzer"):
+            assert analyzer_module.get_nlp_engine_or_none(models) is None
+            assert analyzer_module.get_nlp_engine_or_none(models) is None
+
+        assert len(attempts) == 1
+        messages = [r.getMessage() for r in caplog.records if "no_such_spacy_model_pkg" in r.getMessage()]
+        assert len(messages) == 1
+
+    def test_missing_model_left_to_presidio(self, counting_provider):
+        """Uninstalled models are not probed up front; Presidio loads (or downloads) them."""
+        engine = analyzer_module.get_nlp_engine_or_none((("ja", "no_such_spacy_model_pkg"),))
+
+        assert engine is counting_provider.created[0][1]
+
+
+class TestWarmUp:
+    """Tests for analyzer warm-up."""
+
+    def test_analyzes_each_language(self):
+        """One dummy analyze() call is made per language."""
+        calls = []
+
+        class _Analyzer:
+            def analyze(self, text, language):
+                calls.append(language)
+                return []
+
+        analyzer_module._warm_up(_Analyzer(), ["ja", "en"])
+
+        assert calls == ["ja", "en"]
+
+    def test_failures_do_not_raise(self, caplog):
+        """A failing warm-up is only logged."""
+
+        class _Analyzer:
+            def analyze(self, text, language):
+                raise RuntimeError("boom")
+
+        with caplog.at_level(logging.WARNING, logger="core.analyzer"):
+            analyzer_module._warm_up(_Analyzer(), ["ja"])
+
+        assert "warm-up failed" in caplog.text
+
+
+class TestAnalyzeBatch:
+    """Tests for analyze_batch."""
+
+    def test_reuses_batched_artifacts(self):
+        """Each text is analyzed with the artifacts from one process_batch call."""
+        batch_calls = []
+        analyze_calls = []
+
+        class _NlpEngine:
+            def process_batch(self, texts, language, batch_size):
+                batch_calls.append((list(texts), language, batch_size))
+                return ((t, f"artifacts:{t}") for t in texts)
+
+        class _Analyzer:
+            nlp_engine = _NlpEngine()
+
+            def analyze(self, text, language, nlp_artifacts, **kwargs):
+                analyze_calls.append((text, nlp_artifacts, kwargs))
+                return [text]
+
+        results = analyzer_module.analyze_batch(
+            _Analyzer(), ["a", "b"], language="ja", batch_size=8, entities=["JP_PERSON"]
+        )
+
+        assert results == [["a"], ["b"]]
+        assert batch_calls == [(["a", "b"], "ja", 8)]
+        assert analyze_calls[1] == ("b", "artifacts:b", {"entities": ["JP_PERSON"]})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
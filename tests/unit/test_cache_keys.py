@@ -0,0 +1,21 @@
+"""Unit tests for core.cache_keys."""
+
+from core.cache_keys import freeze, thaw
+
+
+class TestFreeze:
+    """Tests for config freezing used as cache keys."""
+
+    def test_round_trip(self):
+        """thaw(freeze(cfg)) reproduces the original config."""
+        config = {"device": "cuda", "models": ["a", "b"], "nested": {"x": [1, {"y": 2}]}}
+
+        frozen = freeze(config)
+
+        assert hash(frozen) is not None
+        assert thaw(frozen) == config
+
+    def test_none_passes_through(self):
+        """None stays None."""
+        assert freeze(None) is None
+        assert thaw(None) is None
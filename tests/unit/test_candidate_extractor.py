@@ -1,8 +1,9 @@
 """Unit tests for candidate_extractor module."""
 
 import pytest
+
+from core.processors.candidate_extractor import Candidate, CandidateExtractor
 from core.processors.structure_restorer import TextSegment
-from core.processors.candidate_extractor import CandidateExtractor, Candidate
 
 
 class TestCandidateExtractor:
@@ -201,3 +202,147 @@ class TestCandidateExtractor:
         # Should only have one email (not duplicates)
         emails = [c for c in candidates if c.entity_type == "EMAIL_ADDRESS"]
         assert len(emails) == 1
+    
+    def test_rules_skipped_without_trigger_characters(self, extractor, monkeypatch):
+        """Digit/email/gender rules are not run on segments that cannot match."""
+        def fail(*args, **kwargs):
+            raise AssertionError("rule should have been skipped")
+        
+        for name in ("_extract_emails", "_extract_phones", "_extract_postal_codes",
+                     "_extract_dates", "_extract_age", "_extract_gender"):
+            monkeypatch.setattr(extractor, name, fail)
+        segment = TextSegment(
+            section_id="section_0",
+            section_type="contact",
+            line_text="Skills: Python, SQL, チームリーダー経験",
+            char_start=0,
+            char_end=31,
+            line_number=0
+        )
+        
+        assert extractor.extract([segment]) == []
+    
+    def test_overlapping_prefecture_names_scanned(self, extractor):
+        """Every prefecture found in one scan, including overlapping names."""
+        segment = TextSegment(
+            section_id="section_0",
+            section_type="contact",
+            line_text="東京都府中市1-2-3",
+            char_start=0,
+            char_end=11,
+            line_number=0
+        )
+        
+        addresses = extractor._extract_jp_addresses(segment.line_text, 0, segment)
+        
+        assert [(c.text, c.start) for c in addresses] == [
+            ("東京都府中市1-2-3", 0),
+            ("京都府中市1-2-3", 1),
+        ]
+    
+    def test_merge_keeps_best_of_overlapping_chain(self, extractor):
+        """A better overlapping candidate replaces the kept one; later spans still compare against it."""
+        def candidate(entity_type, start, end, score):
+            return Candidate(entity_type, "x" * (end - start), start, end, score,
+                             "rule:test", "section_0", "contact")
+        
+        address = candidate("JP_ADDRESS", 0, 10, 0.75)
+        zip_code = candidate("JP_ZIP_CODE", 5, 13, 0.95)
+        person = candidate("JP_PERSON", 12, 15, 0.9)
+        email = candidate("EMAIL_ADDRESS", 20, 30, 0.95)
+        
+        merged = extractor._merge_candidates([person, email, address, zip_code])
+        
+        assert merged == [zip_code, email]
+    
+    def test_address_ends_at_nearest_delimiter(self, extractor):
+        """The address runs up to the closest delimiter, whichever it is."""
+        segment = TextSegment(
+            section_id="section_0",
+            section_type="contact",
+            line_text="大阪府大阪市北区1-2 TEL 06-1234-5678　email",
+            char_start=0,
+            char_end=34,
+            line_number=0
+        )
+        
+        addresses = extractor._extract_jp_addresses(segment.line_text, 0, segment)
+        
+        assert [c.text for c in addresses] == ["大阪府大阪市北区1-2"]
+    
+    def test_repeated_lines_scanned_once(self, extractor, monkeypatch):
+        """A repeated line reuses its rule hits at the new position and section."""
+        scans = []
+        scan_segment = extractor._scan_segment
+        
+        def counting_scan(text, offset, segment):
+            scans.append(text)
+            return scan_segment(text, offset, segment)
+        
+        monkeypatch.setattr(extractor, "_scan_segment", counting_scan)
+        line = "TEL: 090-1234-5678"
+        segments = [
+            TextSegment(section_id="section_0", section_type="header", line_text=line,
+                        char_start=0, char_end=18, line_number=0),
+            TextSegment(section_id="section_3", section_type="header", line_text=line,
+                        char_start=100, char_end=118, line_number=9),
+        ]
+        
+        candidates = extractor.extract(segments)
+        
+        assert scans == [line]
+        phones = [c for c in candidates if c.entity_type == "PHONE_NUMBER_JP"]
+        assert [(c.start, c.end, c.section_id) for c in phones] == [
+            (5, 18, "section_0"),
+            (105, 118, "section_3"),
+        ]
+    
+    def test_zip_year_range_filter(self, extractor):
+        """Year ranges and digit-prefixed spans are not postal codes."""
+        segment = TextSegment(
+            section_id="section_0",
+            section_type="experience",
+            line_text="2016-2024 勤務 / 5 123-4567 / 〒150-0001",
+            char_start=0,
+            char_end=37,
+            line_number=0
+        )
+        
+        zips = extractor._extract_postal_codes(segment.line_text, 0, segment)
+        
+        assert [c.text for c in zips] == ["〒150-0001"]
+
+
+class TestNerEngineCache:
+    """Tests for sharing loaded NER models between extractors."""
+    
+    def test_ginza_loaded_once_for_all_extractors(self, monkeypatch):
+        """Every extractor reuses the one GiNZA pipeline loaded per process."""
+        import sys
+        import types
+
+        import core.processors.candidate_extractor as extractor_module
+        
+        loads = []
+        fake_spacy = types.ModuleType("spacy")
+        
+        def fake_load(name, disable=()):
+            loads.append((name, tuple(disable)))
+            return object()
+        
+        fake_spacy.load = fake_load
+        monkeypatch.setitem(sys.modules, "spacy", fake_spacy)
+        monkeypatch.setattr(extractor_module, "_load_transformer_recognizers", lambda config: ())
+        extractor_module._load_ginza.cache_clear()
+        try:
+            first = CandidateExtractor(config={}, use_ner=True)
+            second = CandidateExtractor(config={}, use_ner=True)
+            first._init_ner_engines()
+            second._init_ner_engines()
+        finally:
+            extractor_module._load_ginza.cache_clear()
+        
+        assert first._nlp_ja is second._nlp_ja
+        assert len(loads) == 1
+        assert loads[0][0] == "ja_ginza"
+        assert "parser" in loads[0][1]
@@ -0,0 +1,59 @@
+"""Unit tests for config.loader."""
+
+import os
+
+import pytest
+
+from config.loader import _load_config_cached, load_config
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Clear the parsed-config cache around each test."""
+    _load_config_cached.cache_clear()
+    yield
+    _load_config_cached.cache_clear()
+
+
+class TestLoadConfig:
+    """Tests for load_config caching."""
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        """A missing config file yields an empty dict."""
+        assert load_config(str(tmp_path / "missing.yaml")) == {}
+
+    def test_parsed_once_per_mtime(self, tmp_path):
+        """Repeated loads of an unchanged file hit the cache."""
+        path = tmp_path / "config.yaml"
+        path.write_text("transformer:\n  enabled: true\n", encoding="utf-8")
+
+        first = load_config(str(path))
+        second = load_config(str(path))
+
+        assert first == second == {"transformer": {"enabled": True}}
+        assert _load_config_cached.cache_info().hits == 1
+
+    def test_returns_independent_copies(self, tmp_path):
+        """Mutating a returned config must not affect later loads."""
+        path = tmp_path / "config.yaml"
+        path.write_text("transformer:\n  enabled: true\n", encoding="utf-8")
+
+        load_config(str(path))["transformer"]["enabled"] = False
+
+        assert load_config(str(path))["transformer"]["enabled"] is True
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """A changed mtime invalidates the cached parse."""
+        path = tmp_path / "config.yaml"
+        path.write_text("value: 1\n", encoding="utf-8")
+        assert load_config(str(path)) == {"value": 1}
+
+        path.write_text("value: 2\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert load_config(str(path)) == {"value": 2}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -93,6 +93,14 @@ class TestJapaneseBirthDateRecognizer:
 
         assert len(results) > 0
 
+    def test_unseparated_dates_first_match_wins(self):
+        """Dates run together without a separator yield only the first (fused scan)."""
+        recognizer = JapaneseBirthDateRecognizer()
+        text = "生年月日: 1995/04/1995-1-1"
+        results = recognizer.analyze(text, entities=["DATE_OF_BIRTH_JP"])
+
+        assert [text[r.start:r.end] for r in results] == ["1995/04/19"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -8,8 +8,8 @@ Tests the new Masker class to verify:
 
 import pytest
 
-from core.masker import Masker
-from core.masking_result import MaskingResult, EntityInfo
+from core.masker import Masker, build_operators, fast_replace
+from core.masking_result import EntityInfo, MaskingResult
 from core.protocols import NullLogger
 
 
@@ -92,6 +92,244 @@ class TestMaskerDependencyInjection:
         assert mock_anon.anonymize_calls[0]["text"] == "test@example.com"
 
 
+    def test_mask_with_precomputed_results(self, sample_config, monkeypatch):
+        """Precomputed analyzer_results are used instead of re-analyzing."""
+        from presidio_analyzer import RecognizerResult
+
+        masker = Masker(
+            anonymizer=MockAnonymizer(),
+            logger=NullLogger(),
+            config=sample_config
+        )
+
+        def fail_analyze(*args, **kwargs):
+            raise AssertionError("analyze() should not be called")
+
+        monkeypatch.setattr(masker, "analyze", fail_analyze)
+
+        results = [RecognizerResult(entity_type="EMAIL_ADDRESS", start=5, end=21, score=1.0)]
+        result = masker.mask(
+            "mail test@example.com", language="en", log_results=False,
+            analyzer_results=results
+        )
+
+        assert result.masked_text == "mail [MASKED]"
+        assert result.stats.total_entities == 1
+
+    def test_mask_without_entities_skips_anonymizer(self, sample_config):
+        """No detected entities means no anonymizer call and unchanged text."""
+        mock_anon = MockAnonymizer()
+        masker = Masker(
+            anonymizer=mock_anon,
+            logger=NullLogger(),
+            config=sample_config
+        )
+
+        result = masker.mask(
+            "nothing here", language="en", log_results=False, analyzer_results=[]
+        )
+
+        assert result.masked_text == "nothing here"
+        assert result.stats.total_entities == 0
+        assert mock_anon.anonymize_calls == []
+
+    def test_log_skipped_when_logger_disabled(self, sample_config):
+        """Log lines are only built for loggers that would write them."""
+        from presidio_analyzer import RecognizerResult
+
+        class RecordingLogger:
+            def __init__(self):
+                self.messages = []
+
+            def log(self, message):
+                self.messages.append(message)
+
+            def setup_file_handler(self, path):
+                pass
+
+        results = [RecognizerResult(entity_type="EMAIL_ADDRESS", start=5, end=21, score=1.0)]
+        text = "mail test@example.com"
+
+        logger = RecordingLogger()
+        masker = Masker(anonymizer=MockAnonymizer(), logger=logger, config=sample_config)
+        masker.mask(text, language="en", analyzer_results=results)
+        assert len(logger.messages) == 1
+        assert '[EMAIL_ADDRESS] "test@example.com"' in logger.messages[0]
+
+        logger = RecordingLogger()
+        logger.enabled = False
+        masker = Masker(anonymizer=MockAnonymizer(), logger=logger, config=sample_config)
+        masker.mask(text, language="en", analyzer_results=results)
+        assert logger.messages == []
+
+    def test_analyze_skips_text_without_pii_candidates(self, sample_config, monkeypatch):
+        """Text with no letters or digits never reaches the analyzer."""
+        import core.masker as masker_module
+
+        def fail_get_analyzer(*args, **kwargs):
+            raise AssertionError("analyzer should not be used")
+
+        monkeypatch.setattr(masker_module, "_get_analyzer", fail_get_analyzer)
+        masker = Masker(anonymizer=MockAnonymizer(), logger=NullLogger(), config=sample_config)
+
+        assert masker.analyze("  ---  ・・・ \n", language="en") == []
+        assert masker.analyze_batch(["~~~", "   "], language="auto") == [[], []]
+
+    def test_mask_blank_text_skips_analyzer(self, sample_config, monkeypatch):
+        """Empty, whitespace-only or symbol-only text is returned unchanged."""
+        import core.masker as masker_module
+
+        def fail_get_analyzer(*args, **kwargs):
+            raise AssertionError("analyzer should not be used")
+
+        monkeypatch.setattr(masker_module, "_get_analyzer", fail_get_analyzer)
+        mock_anon = MockAnonymizer()
+        masker = Masker(anonymizer=mock_anon, logger=NullLogger(), config=sample_config)
+
+        for text in ("", "   \n\t", "-- ・ --"):
+            result = masker.mask(text, language="auto")
+            assert result.masked_text == text
+            assert result.stats.total_entities == 0
+        assert mock_anon.anonymize_calls == []
+
+    def test_transformer_batch_uses_batched_hybrid_detection(self, sample_config, monkeypatch):
+        """With Transformer NER enabled, candidate texts are analyzed in one batch."""
+        import core.masker as masker_module
+
+        calls = []
+        configs = []
+
+        def fake_batch(texts, **kwargs):
+            calls.append(list(texts))
+            configs.append(kwargs["frozen_app_config"])
+            return [[] for _ in texts]
+
+        def fail_single(*args, **kwargs):
+            raise AssertionError("per-text hybrid analysis should not be used")
+
+        monkeypatch.setattr(masker_module, "hybrid_detection_analyze_batch", fake_batch)
+        monkeypatch.setattr(masker_module, "hybrid_detection_analyze", fail_single)
+        sample_config["transformer"]["enabled"] = True
+        masker = Masker(anonymizer=MockAnonymizer(), logger=NullLogger(), config=sample_config)
+
+        assert masker.analyze_batch(["Taro", "---", "Hanako"], language="ja") == [[], [], []]
+        masker.analyze_batch(["Jiro"], language="ja")
+        assert calls == [["Taro", "Hanako"], ["Jiro"]]
+        # The config is frozen once per Masker, not once per call
+        assert configs[0] is configs[1] is masker._frozen_config
+
+
+class TestAnalyzerCache:
+    """Test that analyzers are built once and shared."""
+
+    def test_analyzer_built_once_per_language(self, monkeypatch):
+        """Repeated lookups for the same language reuse one analyzer."""
+        import core.masker as masker_module
+
+        created = []
+
+        def fake_create_analyzer(language, use_ginza, use_transformer, nlp_size):
+            created.append(language)
+            return object()
+
+        monkeypatch.setattr(masker_module, "create_analyzer", fake_create_analyzer)
+        masker_module._get_analyzer.cache_clear()
+        try:
+            first = masker_module._get_analyzer("en")
+            second = masker_module._get_analyzer("en")
+            other = masker_module._get_analyzer("ja")
+        finally:
+            masker_module._get_analyzer.cache_clear()
+
+        assert first is second
+        assert other is not first
+        assert created == ["en", "ja"]
+
+    def test_default_anonymizer_is_shared(self, sample_config):
+        """Maskers without an injected anonymizer share one AnonymizerEngine."""
+        first = Masker(logger=NullLogger(), config=sample_config)
+        second = Masker(logger=NullLogger(), config=sample_config)
+
+        assert first.anonymizer is second.anonymizer
+
+
+class TestBuildOperators:
+    """Test anonymizer operator construction."""
+
+    def test_operators_from_config(self, sample_config):
+        """Entity masks override the default mask per entity type."""
+        sample_config["masking"]["entity_masks"] = {"PHONE_NUMBER_JP": "***-****-****"}
+
+        operators = build_operators(sample_config)
+
+        assert operators["DEFAULT"].params == {"new_value": "****"}
+        assert operators["PHONE_NUMBER_JP"].params == {"new_value": "***-****-****"}
+
+    def test_operators_memoized_per_masking_config(self, sample_config):
+        """Equal masking settings share one read-only operator mapping."""
+        first = build_operators(sample_config)
+        second = build_operators(dict(sample_config))
+
+        assert first is second
+        with pytest.raises(TypeError):
+            first["DEFAULT"] = None
+
+
+class TestFastReplace:
+    """Test direct span replacement against AnonymizerEngine."""
+
+    def test_matches_anonymizer_engine(self, sample_config):
+        """Output equals AnonymizerEngine, including space-merged entities."""
+        from presidio_analyzer import RecognizerResult
+        from presidio_anonymizer import AnonymizerEngine
+
+        sample_config["masking"]["entity_masks"] = {"PHONE_NUMBER_JP": "***-****-****"}
+        operators = build_operators(sample_config)
+        text = "Taro Yamada 090-1234-5678 / Hanako"
+        results = [
+            RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.9),
+            RecognizerResult(entity_type="PERSON", start=5, end=11, score=0.9),
+            RecognizerResult(entity_type="PHONE_NUMBER_JP", start=12, end=25, score=1.0),
+            RecognizerResult(entity_type="PERSON", start=28, end=34, score=0.8),
+        ]
+
+        expected = AnonymizerEngine().anonymize(
+            text=text, analyzer_results=results, operators=dict(operators)
+        ).text
+
+        assert fast_replace(text, results, operators) == expected == "**** ***-****-**** / ****"
+
+    def test_overlapping_spans_fall_back(self, sample_config):
+        """Overlapping input is left to the full engine."""
+        from presidio_analyzer import RecognizerResult
+
+        results = [
+            RecognizerResult(entity_type="PERSON", start=0, end=6, score=0.9),
+            RecognizerResult(entity_type="JP_ADDRESS", start=4, end=9, score=0.8),
+        ]
+
+        assert fast_replace("abcdefghij", results, build_operators(sample_config)) is None
+
+    def test_default_masker_skips_anonymizer_engine(self, sample_config, monkeypatch):
+        """The default Masker masks without calling AnonymizerEngine."""
+        from presidio_analyzer import RecognizerResult
+
+        masker = Masker(logger=NullLogger(), config=sample_config)
+
+        def fail_anonymize(**kwargs):
+            raise AssertionError("anonymize() should not be called")
+
+        monkeypatch.setattr(masker.anonymizer, "anonymize", fail_anonymize)
+        results = [RecognizerResult(entity_type="EMAIL_ADDRESS", start=5, end=21, score=1.0)]
+
+        result = masker.mask(
+            "mail test@example.com", language="en", log_results=False,
+            analyzer_results=results
+        )
+
+        assert result.masked_text == "mail ****"
+
+
 class TestMaskingResult:
     """Test MaskingResult data class."""
     
@@ -142,6 +380,16 @@ class TestMaskingResult:
         assert info[0]["type"] == "EMAIL_ADDRESS"
         assert info[0]["text"] == "test@example.com"
     
+    def test_dict_round_trip(self):
+        """from_dict(to_dict()) rebuilds an equal result, stats included."""
+        entity = EntityInfo("PERSON", "山田", 0.85, 3, 5)
+        result = MaskingResult.from_entities("氏名：****", (entity,))
+
+        restored = MaskingResult.from_dict(result.to_dict())
+
+        assert restored == result
+        assert restored.stats.entities_by_type == {"PERSON": 1}
+    
     def test_empty_result(self):
         """Test empty MaskingResult."""
         result = MaskingResult(masked_text="no pii here")
@@ -0,0 +1,79 @@
+"""Unit tests for MaskingLogger."""
+
+import pytest
+
+from masking_logging import MaskingLogger
+
+
+@pytest.fixture
+def queued_logger():
+    logger = MaskingLogger(name="masking.test_queued", queued=True)
+    yield logger
+    logger.close()
+
+
+class TestQueuedLogging:
+    """Tests for queued (background-thread) log writes."""
+
+    def test_records_written_on_close(self, queued_logger, tmp_path):
+        """Queued messages are all in the file once the logger is closed."""
+        log_path = tmp_path / "log.txt"
+        queued_logger.setup_file_handler(log_path)
+
+        for i in range(100):
+            queued_logger.log(f"line {i}")
+        queued_logger.close()
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert lines == [f"line {i}" for i in range(100)]
+
+    def test_switching_files_drains_previous(self, queued_logger, tmp_path):
+        """Records logged before a file switch land in the earlier file."""
+        first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+
+        queued_logger.setup_file_handler(first)
+        queued_logger.log("one")
+        queued_logger.setup_file_handler(second)
+
+        assert first.read_text(encoding="utf-8") == "one\n"
+
+        queued_logger.log("two")
+        queued_logger.close()
+        assert second.read_text(encoding="utf-8") == "two\n"
+
+    def test_flush_writes_pending_records(self, queued_logger, tmp_path):
+        """flush() drains the queue now and keeps the logger usable."""
+        log_path = tmp_path / "log.txt"
+        queued_logger.setup_file_handler(log_path)
+
+        queued_logger.log("one")
+        queued_logger.flush()
+        assert log_path.read_text(encoding="utf-8") == "one\n"
+
+        queued_logger.log("two")
+        queued_logger.flush()
+        assert log_path.read_text(encoding="utf-8") == "one\ntwo\n"
+
+    def test_enabled_with_queue_handler(self, queued_logger, tmp_path):
+        """A queued file handler counts as a real destination."""
+        queued_logger.setup_file_handler(tmp_path / "log.txt")
+
+        assert queued_logger.enabled is True
+
+    def test_second_instance_stops_first_listener(self, queued_logger, tmp_path):
+        """Loggers sharing a name share one listener; switching drains the other's."""
+        from masking_logging import masking_logger
+
+        first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+        other = MaskingLogger(name="masking.test_queued", queued=True)
+
+        queued_logger.setup_file_handler(first)
+        queued_logger.log("one")
+        other.setup_file_handler(second)
+
+        assert first.read_text(encoding="utf-8") == "one\n"
+
+        other.log("two")
+        other.close()
+        assert "masking.test_queued" not in masking_logger._listeners
+        assert second.read_text(encoding="utf-8") == "two\n"
@@ -0,0 +1,205 @@
+"""Unit tests for MaskingService result caching."""
+
+import os
+
+from core.masking_result import EntityInfo, MaskingResult
+from core.masking_service import MaskingService
+from core.protocols import NullLogger
+
+
+class _Extractor:
+    def __init__(self, text):
+        self.text = text
+
+    def extract(self, file_path):
+        if isinstance(self.text, dict):
+            return self.text[file_path]
+        return self.text
+
+
+class _RecordingLogger:
+    """Logger stand-in that records which log file each message went to."""
+
+    def __init__(self):
+        self.path = None
+        self.records = []
+        self.flushes = 0
+
+    def setup_file_handler(self, path):
+        self.path = path
+
+    def log(self, message):
+        self.records.append((self.path, message))
+
+    def flush(self):
+        self.flushes += 1
+
+
+class _CountingMasker:
+    """Masker stand-in that counts mask() calls."""
+
+    def __init__(self, config=None, logger=None):
+        self.config = config or {"masking": {"default_mask": "****"}}
+        self.logger = logger
+        self.mask_calls = 0
+        self.logged = []
+
+    def analyze_batch(self, texts, language="auto"):
+        return [None] * len(texts)
+
+    def mask(self, text, language="auto", log_results=True, analyzer_results=None):
+        self.mask_calls += 1
+        entity = EntityInfo("PERSON", text[:4], 0.9, 0, 4)
+        result = MaskingResult.from_entities("****" + text[4:], (entity,))
+        if log_results:
+            self.log_entities(result.entities)
+        return result
+
+    def log_entities(self, entities):
+        self.logged.append(entities)
+        if self.logger is not None:
+            for entity in entities:
+                self.logger.log(entity.text)
+
+
+class TestResultCache:
+    """Tests for the on-disk MaskingResult cache."""
+
+    def test_second_run_served_from_cache(self, tmp_path):
+        """The same text, language and config is only masked once."""
+        masker = _CountingMasker()
+        service = MaskingService(
+            _Extractor("Taro lives here"), masker, NullLogger(), cache_dir=tmp_path / "cache"
+        )
+        input_path = tmp_path / "doc.pdf"
+
+        first = service.process_file(input_path, tmp_path / "a.txt", language="ja")
+        second = service.process_file(input_path, tmp_path / "b.txt", language="ja")
+
+        assert masker.mask_calls == 1
+        assert second == first
+        assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "**** lives here"
+        assert masker.logged == [first.entities, first.entities]
+
+    def test_cache_hit_logged_to_its_own_file(self, tmp_path):
+        """A cache hit in a batch logs its entities to that job's log file."""
+        cache_dir = tmp_path / "cache"
+        a_pdf, b_pdf = tmp_path / "a.pdf", tmp_path / "b.pdf"
+        extractor = _Extractor({str(a_pdf): "Taro lives here", str(b_pdf): "Jiro lives here"})
+        logger = _RecordingLogger()
+        masker = _CountingMasker(logger=logger)
+        service = MaskingService(extractor, masker, logger, cache_dir=cache_dir)
+
+        # Prime the cache for b only
+        service.process_file(b_pdf, tmp_path / "b0.txt", tmp_path / "b0.log", language="ja")
+        logger.records.clear()
+
+        service.process_files(
+            [
+                (a_pdf, tmp_path / "a.txt", tmp_path / "a.log"),
+                (b_pdf, tmp_path / "b.txt", tmp_path / "b.log"),
+            ],
+            language="ja",
+        )
+
+        assert masker.mask_calls == 2
+        assert sorted(logger.records) == [
+            (tmp_path / "a.log", "Taro"),
+            (tmp_path / "b.log", "Jiro"),
+        ]
+
+    def test_language_and_config_change_key(self, tmp_path):
+        """A different language or masker config misses the cache."""
+        cache_dir = tmp_path / "cache"
+        input_path = tmp_path / "doc.pdf"
+        masker = _CountingMasker()
+        service = MaskingService(_Extractor("Taro"), masker, NullLogger(), cache_dir=cache_dir)
+        service.process_file(input_path, tmp_path / "a.txt", language="ja")
+        service.process_file(input_path, tmp_path / "a.txt", language="en")
+
+        other = _CountingMasker({"masking": {"default_mask": "[PII]"}})
+        MaskingService(_Extractor("Taro"), other, NullLogger(), cache_dir=cache_dir).process_file(
+            input_path, tmp_path / "a.txt", language="ja"
+        )
+
+        assert masker.mask_calls == 2
+        assert other.mask_calls == 1
+
+    def test_dictionary_change_misses_cache(self, tmp_path):
+        """Editing the allow-list dictionary invalidates cached results."""
+        cache_dir = tmp_path / "cache"
+        input_path = tmp_path / "doc.pdf"
+        dict_path = tmp_path / "terms.dic"
+        dict_path.write_text("Python\n", encoding="utf-8")
+        config = {
+            "masking": {"default_mask": "****"},
+            "allow_list": {"enabled": True, "dictionary_path": str(dict_path)},
+        }
+
+        masker = _CountingMasker(config)
+        MaskingService(_Extractor("Taro"), masker, NullLogger(), cache_dir=cache_dir).process_file(
+            input_path, tmp_path / "a.txt", language="ja"
+        )
+
+        dict_path.write_text("Python\nTaro\n", encoding="utf-8")
+        os.utime(dict_path, ns=(0, dict_path.stat().st_mtime_ns + 1_000_000))
+        MaskingService(_Extractor("Taro"), masker, NullLogger(), cache_dir=cache_dir).process_file(
+            input_path, tmp_path / "a.txt", language="ja"
+        )
+
+        assert masker.mask_calls == 2
+
+    def test_version_change_misses_cache(self, tmp_path, monkeypatch):
+        """A new cache format or package/model version invalidates cached results."""
+        from core import masking_service
+
+        cache_dir = tmp_path / "cache"
+        input_path = tmp_path / "doc.pdf"
+        masker = _CountingMasker()
+        MaskingService(_Extractor("Taro"), masker, NullLogger(), cache_dir=cache_dir).process_file(
+            input_path, tmp_path / "a.txt", language="ja"
+        )
+
+        monkeypatch.setattr(masking_service, "_CACHE_FORMAT", masking_service._CACHE_FORMAT + 1)
+        MaskingService(_Extractor("Taro"), masker, NullLogger(), cache_dir=cache_dir).process_file(
+            input_path, tmp_path / "a.txt", language="ja"
+        )
+
+        monkeypatch.setattr(masking_service, "_package_version", lambda name: "99.0")
+        MaskingService(_Extractor("Taro"), masker, NullLogger(), cache_dir=cache_dir).process_file(
+            input_path, tmp_path / "a.txt", language="ja"
+        )
+
+        assert masker.mask_calls == 3
+
+    def test_no_cache_dir_always_masks(self, tmp_path):
+        """Without cache_dir every call runs the masker."""
+        masker = _CountingMasker()
+        service = MaskingService(_Extractor("Taro"), masker, NullLogger())
+
+        service.process_file(tmp_path / "doc.pdf", tmp_path / "a.txt")
+        service.process_file(tmp_path / "doc.pdf", tmp_path / "a.txt")
+
+        assert masker.mask_calls == 2
+
+
+class TestLogFlush:
+    """Queued log records are written out before the service returns."""
+
+    def test_process_file_flushes_log(self, tmp_path):
+        """process_file flushes once the document is done (no reliance on atexit)."""
+        logger = _RecordingLogger()
+        service = MaskingService(_Extractor("Taro"), _CountingMasker(logger=logger), logger)
+
+        service.process_file(tmp_path / "doc.pdf", tmp_path / "a.txt", tmp_path / "a.log")
+
+        assert logger.flushes == 1
+
+    def test_process_files_flushes_log(self, tmp_path):
+        """process_files flushes after the last document."""
+        logger = _RecordingLogger()
+        service = MaskingService(_Extractor("Taro"), _CountingMasker(logger=logger), logger)
+
+        service.process_files([(tmp_path / "doc.pdf", tmp_path / "a.txt", tmp_path / "a.log")])
+
+        assert logger.flushes == 1
@@ -83,6 +83,24 @@ class TestRecognizerRegistry:
         ja_recognizers = analyzer.registry.get_recognizers(language="ja", all_fields=True)
         assert len(ja_recognizers) >= 7
 
+    def test_apply_to_analyzer_validates_recognizers(self):
+        """Recognizers go through Presidio's add_recognizer, which rejects non-recognizers."""
+        from types import SimpleNamespace
+
+        from presidio_analyzer import RecognizerRegistry as PresidioRegistry
+
+        from recognizers.registry import RecognizerConfig, RecognizerRegistry
+
+        registry = RecognizerRegistry()
+        registry.register(RecognizerConfig(
+            recognizer=object(), type="pattern", language="ja",
+            entity_type="JP_BOGUS", description="not a recognizer"
+        ))
+        analyzer = SimpleNamespace(registry=PresidioRegistry(supported_languages=["ja"]))
+
+        with pytest.raises(ValueError):
+            registry.apply_to_analyzer(analyzer)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
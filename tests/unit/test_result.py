@@ -0,0 +1,98 @@
+"""Unit tests for result deduplication and merging."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from presidio_analyzer import RecognizerResult
+
+from core.processors.result import deduplicate_results, merge_results
+
+
+def _result(start, end, score, entity_type="PERSON"):
+    return RecognizerResult(entity_type=entity_type, start=start, end=end, score=score)
+
+
+class TestDeduplicateResults:
+    """Tests for deduplicate_results."""
+
+    def test_higher_score_wins_overlap(self):
+        """Overlapping spans keep only the higher-scoring result."""
+        low = _result(0, 10, 0.5)
+        high = _result(5, 12, 0.9)
+
+        assert deduplicate_results([low, high], "") == [high]
+
+    def test_adjacent_spans_both_kept(self):
+        """Spans that touch without sharing a position do not overlap."""
+        first = _result(0, 5, 0.9)
+        second = _result(5, 9, 0.8)
+
+        assert deduplicate_results([second, first], "") == [first, second]
+
+    def test_span_between_kept_spans(self):
+        """A span fitting in the gap between kept spans is kept."""
+        left = _result(0, 4, 1.0)
+        right = _result(10, 14, 1.0)
+        middle = _result(4, 10, 0.5)
+        inside = _result(2, 11, 0.4)
+
+        assert deduplicate_results([left, right, middle, inside], "") == [left, middle, right]
+
+    def test_empty_input(self):
+        """Empty input is returned as-is."""
+        assert deduplicate_results([], "") == []
+
+
+class TestMergeResults:
+    """Tests for merge_results."""
+
+    def test_minor_overlap_kept(self):
+        """Results overlapping by half or less of their span are both kept."""
+        en = [_result(0, 10, 0.9)]
+        ja = [_result(8, 18, 0.8)]
+
+        assert merge_results(en, ja) == [en[0], ja[0]]
+
+    def test_major_overlap_dropped(self):
+        """A lower-scoring result mostly covered by another is dropped."""
+        en = [_result(0, 10, 0.9)]
+        ja = [_result(2, 11, 0.8)]
+
+        assert merge_results(en, ja) == en
+
+    def test_overlap_counts_union_of_kept_spans(self):
+        """Coverage from several kept results adds up against a later one."""
+        left = _result(0, 4, 0.9)
+        right = _result(6, 10, 0.9)
+        spanning = _result(2, 8, 0.5)
+
+        assert merge_results([left, right], [spanning]) == [left, right]
+
+    def test_empty_span_kept(self):
+        """A zero-length result covers nothing and is never dropped."""
+        en = [_result(0, 10, 0.9)]
+        ja = [_result(5, 5, 0.8)]
+
+        assert merge_results(en, ja) == [en[0], ja[0]]
+
+
+class TestLazyPackageImport:
+    """core.processors resolves its exports on first use."""
+
+    def test_result_import_skips_hybrid_detection(self):
+        """Importing core.processors.result does not load hybrid_detection or Presidio."""
+        watched = ("core.processors.hybrid_detection", "presidio_analyzer")
+        code = (
+            "import sys, core.processors.result; "
+            f"print([m for m in {watched!r} if m in sys.modules])"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        assert output == "[]"
@@ -47,6 +47,44 @@ class TestTransformerNERRecognizer:
         assert "LOCATION" in recognizer.supported_entities
         assert recognizer.min_confidence == 0.8
 
+    def test_batch_and_precision_settings(self):
+        """batch_size is passed through; fp16 defaults on only for CUDA."""
+        from recognizers import create_transformer_recognizer
+
+        model_config = {
+            "model_name": "dslim/bert-base-NER",
+            "entities": ["PERSON"]
+        }
+
+        cpu_recognizer = create_transformer_recognizer(
+            model_config=model_config,
+            language="en",
+            transformer_config={"device": "cpu", "batch_size": 8}
+        )
+        cuda_recognizer = create_transformer_recognizer(
+            model_config=model_config,
+            language="en",
+            transformer_config={"device": "cuda"}
+        )
+
+        assert cpu_recognizer.batch_size == 8
+        assert cpu_recognizer.fp16 is False
+        assert cuda_recognizer.batch_size == 16
+        assert cuda_recognizer.fp16 is True
+        assert cpu_recognizer.int8 is False
+
+    def test_int8_setting_passed_through(self):
+        """int8 quantization is opt-in via transformer_config."""
+        from recognizers import create_transformer_recognizer
+
+        recognizer = create_transformer_recognizer(
+            model_config={"model_name": "dslim/bert-base-NER", "entities": ["PERSON"]},
+            language="en",
+            transformer_config={"device": "cpu", "int8": True}
+        )
+
+        assert recognizer.int8 is True
+
     def test_create_japanese_recognizer(self):
         """Test creating Japanese Transformer recognizer via config-driven factory."""
         from recognizers import create_transformer_recognizer